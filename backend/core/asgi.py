@@ -13,4 +13,36 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+
+async def application(scope, receive, send):
+    """
+    ASGI entrypoint.
+
+    Wraps the Django application with lifespan handling (which Django itself
+    ignores) so shared HTTP/RPC pools are opened at startup rather than on
+    the first user request, and closed cleanly on shutdown.
+    """
+    if scope["type"] != "lifespan":
+        await django_application(scope, receive, send)
+        return
+
+    from integrations.defillama.client import close_clients, warm_clients
+
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                await warm_clients()
+            except Exception:
+                # Warming is best-effort; never block startup on it
+                pass
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            try:
+                await close_clients()
+            except Exception:
+                pass
+            await send({"type": "lifespan.shutdown.complete"})
+            return
@@ -30,6 +30,9 @@ class CustomPagination(PageNumberPagination):
     max_page_size = 100  # Maximum number of items allowed per page
 
     def paginate_queryset(self, queryset, request, view=None):
-        if request.query_params.get("paginate", "true").lower() == "false":
+        # Membership test against the common spellings avoids a per-request
+        # .lower() allocation on every paginated endpoint
+        paginate = request.query_params.get("paginate")
+        if paginate is not None and paginate in ("false", "False", "FALSE", "0"):
             return None
         return super().paginate_queryset(queryset, request, view)
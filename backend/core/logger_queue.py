@@ -0,0 +1,124 @@
+"""
+Bounded background queue for exception-handler log writes.
+
+Every error branch in ``custom_exception_handler`` used to call
+``LoggerService.create_logg`` inline, adding a full DB INSERT to the
+response latency of every 4xx/5xx. This module decouples the write: the
+handler enqueues a lightweight snapshot of the request and returns
+immediately, while a single daemon worker drains the queue and performs
+the INSERTs. If the queue is full the log entry is dropped rather than
+blocking the response.
+"""
+
+import logging
+import queue
+import reprlib
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Bounded repr applied when a payload is finally persisted; keeps a stray
+# request object or queryset in task args from producing a megabyte row
+_bounded_repr = reprlib.Repr()
+_bounded_repr.maxstring = 200
+_bounded_repr.maxother = 200
+
+
+def _stringify(value) -> str:
+    """Serialize a payload field just before persisting, off the hot path."""
+    if isinstance(value, str):
+        return value
+    return _bounded_repr.repr(value)
+
+_Q: queue.Queue = queue.Queue(maxsize=1000)
+_worker_lock = threading.Lock()
+_worker_started = False
+
+
+def _extract_request_meta(request) -> dict:
+    """Snapshot the request fields LoggerService needs, safe to use off-thread."""
+    if isinstance(request, dict):
+        meta = dict(request)
+        meta.setdefault("path", "")
+        meta.setdefault("method", "")
+        return meta
+
+    meta = {
+        "path": request.path,
+        "method": request.method,
+    }
+    try:
+        meta["data"] = request.data
+    except Exception:
+        pass
+    return meta
+
+
+def _worker():
+    # Imported here to avoid pulling Django models in at module import time
+    from parameters.common.logger.logger_service import LoggerService
+
+    while True:
+        kind, payload = _Q.get()
+        try:
+            if kind == "manual":
+                status_code, event_path, request_method, input_data, output = payload
+                LoggerService.create__manual_logg(
+                    status_code,
+                    event_path,
+                    request_method,
+                    _stringify(input_data),
+                    _stringify(output),
+                )
+            else:
+                LoggerService.create_logg(*payload)
+        except Exception as e:
+            logger.warning(f"Background log write failed: {e}")
+        finally:
+            _Q.task_done()
+
+
+def _ensure_worker():
+    global _worker_started
+    if _worker_started:
+        return
+    with _worker_lock:
+        if not _worker_started:
+            thread = threading.Thread(
+                name="logger_queue_worker", target=_worker, daemon=True
+            )
+            thread.start()
+            _worker_started = True
+
+
+def enqueue_log(status_code, request, output):
+    """
+    Queue a log write without blocking the caller.
+
+    Drop-in replacement for LoggerService.create_logg on the error response
+    hot path; drops the entry silently if the queue is full.
+    """
+    _ensure_worker()
+    try:
+        _Q.put_nowait(
+            ("request", (status_code, _extract_request_meta(request), output))
+        )
+    except queue.Full:
+        pass
+
+
+def enqueue_manual_log(status_code, event_path, request_method, input_data, output):
+    """
+    Queue a manual log write without blocking the caller.
+
+    Drop-in replacement for LoggerService.create__manual_logg; drops the
+    entry silently if the queue is full. ``input_data`` and ``output`` may
+    be native objects — they are stringified by the worker, not the caller.
+    """
+    _ensure_worker()
+    try:
+        _Q.put_nowait(
+            ("manual", (status_code, event_path, request_method, input_data, output))
+        )
+    except queue.Full:
+        pass
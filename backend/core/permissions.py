@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from rest_framework.exceptions import PermissionDenied, Throttled
 from rest_framework.permissions import BasePermission
 from rest_framework.response import Response
@@ -10,6 +11,21 @@ ADMIN = 1
 MEMBER = 2
 
 
+def get_role_identifier(request):
+    """
+    Return request.user.platform_role.identifier, memoized on the request.
+
+    platform_role is a FK descriptor, so without this each of get_queryset,
+    has_permission and has_object_permission can trigger its own SELECT on
+    the same request.
+    """
+    role_id = getattr(request, "_role_id", None)
+    if role_id is None:
+        role_id = request.user.platform_role.identifier
+        request._role_id = role_id
+    return role_id
+
+
 class SuperuserFilterMixin:
     """
     Custom mixin to filter queryset based on user type (superuser or non-superuser).
@@ -21,7 +37,7 @@ class SuperuserFilterMixin:
         # Override queryset to filter for non-superusers
         if (
             not self.request.user.is_authenticated
-            or not self.request.user.platform_role.identifier == ADMIN
+            or not get_role_identifier(self.request) == ADMIN
         ):
             queryset = queryset.filter(is_active=True)
 
@@ -37,21 +53,33 @@ class IsMemberOrAdmin(BasePermission):
 
     def has_permission(self, request, view):
         """Works in every HTTP method"""
-        role = request.user.platform_role.identifier
-        if role not in self.allowed_read_roles:
+        role = get_role_identifier(request)
+        if role not in self.allowed_read_write_roles:
             return False
         elif role == ADMIN:
             return True
 
         member_id = view.kwargs.get("member_id")
         if member_id is not None:
-            return Member.objects.filter(user=request.user, id=member_id).exists()
+            # Same (user, member) pair is re-checked on every request a
+            # chatty frontend makes; cache the membership bit briefly so
+            # only 1 in N requests pays the SELECT
+            key = f"memperm:{request.user.id}:{member_id}"
+            ok = cache.get(key)
+            if ok is None:
+                ok = (
+                    Member.objects.filter(user=request.user, id=member_id)
+                    .values("pk")[:1]
+                    .exists()
+                )
+                cache.set(key, ok, 60)
+            return ok
         else:
             return True
 
     def has_object_permission(self, request, view, obj):
         """Only works in GET, PUT, PATCH, DELETE when get_object() is called"""
-        if request.user.platform_role.identifier == ADMIN:
+        if get_role_identifier(request) == ADMIN:
             return True
         # see if obj has user attribute
         if hasattr(obj, "user"):
@@ -30,6 +30,16 @@ ENVIRONMENT = os.environ.get("ENVIRONMENT") or env_config.get(
 )
 PROD_ENVIRONMENTS = ["prod", "production"]
 
+# Fraction of successful (2xx/3xx) requests whose logs are persisted;
+# errors are always logged. 1.0 keeps everything (dev default), prod
+# trims to one in ten.
+LOGGER_SAMPLE_RATE = float(
+    env_config.get(
+        "LOGGER_SAMPLE_RATE",
+        default="0.1" if ENVIRONMENT in PROD_ENVIRONMENTS else "1.0",
+    )
+)
+
 # Print environment info on startup
 print(f"[SETTINGS] ENVIRONMENT: {ENVIRONMENT}")
 print(f"[SETTINGS] DOTENV_FILE: {DOTENV_FILE}")
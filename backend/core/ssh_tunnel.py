@@ -5,12 +5,15 @@ This module provides direct SSH tunneling without requiring sshtunnel,
 which has compatibility issues with Paramiko 4.0.0 due to the removal of DSSKey class.
 """
 
+import io
 import paramiko
 import threading
+import random
 import socket
-import select
+import selectors
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Any
 
 logger = logging.getLogger(__name__)
@@ -58,10 +61,15 @@ class ParametrikoSSHTunnel:
         self.local_socket: Optional[socket.socket] = None
         self.tunnel_thread: Optional[threading.Thread] = None
         self.keepalive_thread: Optional[threading.Thread] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._selector: Optional[selectors.DefaultSelector] = None
         self.is_running = False
         self._local_bind_port: Optional[int] = None
         self._local_bind_host: Optional[str] = None
         self._connection_lock = threading.Lock()
+        self._cached_key: Optional[paramiko.PKey] = None
+        self._cached_key_type: Optional[type] = None
+        self._consec_failures = 0
 
     @property
     def local_bind_port(self) -> Optional[int]:
@@ -137,6 +145,22 @@ class ParametrikoSSHTunnel:
         # Get actual bound address
         self._local_bind_host, self._local_bind_port = self.local_socket.getsockname()
 
+        # epoll/kqueue-backed reactor for the accept loop; O(1) wakeup per
+        # ready fd versus select()'s O(N) scan and FD_SETSIZE cap
+        if self._selector is not None:
+            self._selector.close()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.local_socket, selectors.EVENT_READ, data="accept")
+
+        # Reusable worker pool for per-connection forwarding. Spawning a new
+        # thread per accepted connection costs ~100µs plus a full pthread
+        # stack each; the pool amortizes that across the tunnel lifetime and
+        # caps memory under connection bursts.
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=64, thread_name_prefix="ssh_tun_fwd"
+            )
+
         # Start background threads
         self.is_running = True
         self.tunnel_thread = threading.Thread(
@@ -153,7 +177,10 @@ class ParametrikoSSHTunnel:
     def _load_private_key(self) -> Any:
         """
         Load private key with support for multiple key formats.
-        Tries different key types (RSA, Ed25519, ECDSA) until one works.
+        Probes the PEM header to pick the right key class directly, falling
+        back to trying each type (RSA, Ed25519, ECDSA) until one works.
+        The loaded key is cached on the instance so reconnects skip the
+        file read and PEM decode entirely.
 
         Returns:
             Paramiko key object
@@ -161,17 +188,43 @@ class ParametrikoSSHTunnel:
         Raises:
             ValueError: If no supported key format was found
         """
+        if self._cached_key is not None:
+            return self._cached_key
+
         key_types = [
             paramiko.RSAKey,
             paramiko.Ed25519Key,
             paramiko.ECDSAKey,
         ]
 
+        # Read the file once; each from_private_key_file call would re-open
+        # and re-read it from disk otherwise
+        try:
+            with open(self.ssh_pkey_path, "r") as f:
+                key_data = f.read()
+        except OSError as e:
+            raise ValueError(
+                f"Could not read private key file {self.ssh_pkey_path}: {e}"
+            )
+
+        # Probe the header so the right class is tried first instead of
+        # paying an expensive SSHException round for each wrong type
+        header = key_data[:64]
+        if "-----BEGIN OPENSSH" in header:
+            key_types.sort(key=lambda kt: kt is not paramiko.Ed25519Key)
+        elif "-----BEGIN RSA" in header:
+            key_types.sort(key=lambda kt: kt is not paramiko.RSAKey)
+        elif "-----BEGIN EC" in header:
+            key_types.sort(key=lambda kt: kt is not paramiko.ECDSAKey)
+
         for key_type in key_types:
             try:
-                return key_type.from_private_key_file(self.ssh_pkey_path)
+                key = key_type.from_private_key(io.StringIO(key_data))
             except (paramiko.SSHException, ValueError):
                 continue
+            self._cached_key = key
+            self._cached_key_type = key_type
+            return key
 
         raise ValueError(
             f"Could not load private key from {self.ssh_pkey_path}. "
@@ -191,7 +244,16 @@ class ParametrikoSSHTunnel:
                     with self._connection_lock:
                         if self.is_running:  # Double-check after acquiring lock
                             self._reconnect()
-                time.sleep(self.keepalive_interval)
+                if self._consec_failures:
+                    # Jittered exponential backoff so many tunnels in one
+                    # process don't hammer a down SSH server in lockstep
+                    delay = min(
+                        self.keepalive_interval * 2 ** (self._consec_failures - 1),
+                        300,
+                    ) + random.uniform(0, 5)
+                    time.sleep(delay)
+                else:
+                    time.sleep(self.keepalive_interval)
             except Exception as e:
                 logger.error(f"Error in connection monitor: {e}")
                 time.sleep(5)
@@ -209,8 +271,10 @@ class ParametrikoSSHTunnel:
 
             # Re-establish connection
             self._establish_connection()
+            self._consec_failures = 0
             logger.info("SSH tunnel reconnected successfully")
         except Exception as e:
+            self._consec_failures += 1
             logger.error(f"Failed to reconnect SSH tunnel: {e}")
 
     def stop(self):
@@ -221,6 +285,17 @@ class ParametrikoSSHTunnel:
         logger.info("Stopping SSH tunnel...")
         self.is_running = False
 
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+        if self._selector:
+            try:
+                self._selector.close()
+                self._selector = None
+            except Exception as e:
+                logger.warning(f"Error closing selector: {e}")
+
         if self.local_socket:
             try:
                 self.local_socket.close()
@@ -252,40 +327,66 @@ class ParametrikoSSHTunnel:
         """
         while self.is_running:
             try:
-                if not self.local_socket:
+                if not self.local_socket or not self._selector:
                     break
 
-                ready, _, _ = select.select([self.local_socket], [], [], 1.0)
-                if not ready:
+                events = self._selector.select(timeout=1.0)
+                if not events:
                     continue
 
-                local_conn, addr = self.local_socket.accept()
+                if not any(key.data == "accept" for key, _ in events):
+                    continue
 
-                # Create SSH channel
-                with self._connection_lock:
-                    if not self.transport or not self.transport.is_active():
-                        local_conn.close()
-                        continue
+                local_conn, addr = self.local_socket.accept()
+                self._tune_socket(local_conn)
+
+                # Create SSH channel. Attribute reads are atomic on CPython,
+                # so snapshot the transport into a local instead of taking
+                # the connection lock; the lock stays reserved for the rare
+                # _reconnect() path so accepts never serialize behind it.
+                transport = self.transport
+                if transport is None or not transport.is_active():
+                    local_conn.close()
+                    continue
 
-                    channel = self.transport.open_channel(
-                        "direct-tcpip", (self.remote_host, self.remote_port), addr
-                    )
+                channel = transport.open_channel(
+                    "direct-tcpip", (self.remote_host, self.remote_port), addr
+                )
 
                 if channel is None:
                     local_conn.close()
                     continue
 
-                # Start forwarding thread
-                forward_thread = threading.Thread(
-                    target=self._forward_data, args=(local_conn, channel), daemon=True
-                )
-                forward_thread.start()
+                # Forward on the shared worker pool (threads are reused)
+                self._pool.submit(self._forward_data, local_conn, channel)
 
             except Exception as e:
                 if self.is_running:
                     logger.error(f"Error handling connections: {e}")
                 break
 
+    @staticmethod
+    def _tune_socket(conn: socket.socket):
+        """
+        Tune an accepted socket for interactive forwarding.
+        Disables Nagle's algorithm (which adds up to 40ms per small write on
+        query/response workloads) and enables OS-level keepalive so half-open
+        connections are reaped.
+        """
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Linux-only keepalive tuning: probe after 60s idle, every 10s,
+            # drop after 3 missed probes
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        except OSError as e:
+            logger.debug(f"Could not tune accepted socket: {e}")
+
     def _forward_data(self, local_conn: socket.socket, channel: paramiko.Channel):
         """
         Forward data between local connection and SSH channel.
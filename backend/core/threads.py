@@ -1,14 +1,27 @@
+import asyncio
+import atexit
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import logging
 
 from rest_framework import status
 
-from parameters.common.logger.logger_service import LoggerService
+from core.logger_queue import enqueue_log, enqueue_manual_log
 from core.sentry_utils import set_sentry_tags, set_sentry_extras
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for background tasks. Spawning a fresh OS thread per call pays
+# stack allocation + pthread_create each time and has no backpressure; the
+# pool amortizes thread creation and caps concurrency under bursts.
+_BG_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BG_POOL_SIZE", "16")),
+    thread_name_prefix="bg-task",
+)
+atexit.register(_BG_POOL.shutdown, wait=False)
+
 
 def run_in_background(manual_log=False):
     """
@@ -40,45 +53,51 @@ def run_in_background(manual_log=False):
                 )
 
                 try:
-                    func(*args, **kwargs)
+                    if asyncio.iscoroutinefunction(func):
+                        # Async tasks get their own loop in this worker
+                        # thread, so neither the task body nor the blocking
+                        # log writes ever touch a caller's event loop
+                        asyncio.run(func(*args, **kwargs))
+                    else:
+                        func(*args, **kwargs)
                     if manual_log:
-                        LoggerService.create__manual_logg(
+                        enqueue_manual_log(
                             status.HTTP_200_OK,
                             f"Background task {func.__name__} executed successfully",
                             "POST",
-                            str({"args": args, "kwargs": kwargs}),
-                            str({"error": None}),
+                            {"args": args, "kwargs": kwargs},
+                            {"error": None},
                         )
                     else:
-                        LoggerService.create_logg(
+                        enqueue_log(
                             status.HTTP_200_OK,
                             kwargs.get("request", None) or args[0],
                             f"Background task {func.__name__} executed successfully",
-                            background_task=True,
                         )
                 except Exception as e:
                     # Log the error first
                     if manual_log:
-                        LoggerService.create__manual_logg(
+                        enqueue_manual_log(
                             status.HTTP_500_INTERNAL_SERVER_ERROR,
                             f"Background error while executing {func.__name__}",
                             "POST",
-                            str({"args": args, "kwargs": kwargs}),
-                            str({"error": str(e)}),
+                            {"args": args, "kwargs": kwargs},
+                            {"error": str(e)},
                         )
                     else:
-                        LoggerService.create_logg(
+                        enqueue_log(
                             status.HTTP_400_BAD_REQUEST,
                             kwargs.get("request", None) or args[0],
                             f"Background error while executing {func.__name__}: {e}",
-                            background_task=True,
                         )
 
                     # Add additional context to Sentry before capturing
+                    # Native objects: the Sentry serializer trims them lazily,
+                    # and only for events that survive sampling
                     set_sentry_extras(
                         {
-                            "args": str(args),
-                            "kwargs": str(kwargs),
+                            "args": args,
+                            "kwargs": kwargs,
                             "error_message": str(e),
                             "function": func.__name__,
                             "module": func.__module__,
@@ -98,8 +117,13 @@ def run_in_background(manual_log=False):
                     )
                     raise
 
-            thread = threading.Thread(target=background_task, daemon=True)
-            thread.start()
+            try:
+                return _BG_POOL.submit(background_task)
+            except RuntimeError:
+                # Pool already shut down (interpreter exiting); fall back to
+                # a plain thread so the task isn't silently dropped
+                thread = threading.Thread(target=background_task, daemon=True)
+                thread.start()
 
         return wrapper
 
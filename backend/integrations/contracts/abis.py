@@ -4,6 +4,52 @@ Contract ABIs for on-chain interactions.
 Minimal ABIs - only functions we actually need.
 """
 
+from eth_utils import function_signature_to_4byte_selector
+
+# 4-byte selectors precomputed once at import. Hot read paths build their
+# calldata from these directly, skipping web3's contract abstraction
+# (ABI walk + keccak of the signature per construction).
+SELECTORS = {
+    "balanceOf": function_signature_to_4byte_selector("balanceOf(address)"),
+    "decimals": function_signature_to_4byte_selector("decimals()"),
+    "convertToAssets": function_signature_to_4byte_selector(
+        "convertToAssets(uint256)"
+    ),
+}
+
+# Multicall3 - same address on all supported chains; aggregate3 packs many
+# contract reads into a single eth_call
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
 # Standard ERC20 - balanceOf, decimals, symbol
 ERC20_ABI = [
     {
@@ -6,9 +6,14 @@ Reads vault balances across Aave, Morpho, and Euler protocols.
 
 import asyncio
 import logging
+import math
+import time
+from dataclasses import dataclass
 from decimal import Decimal
+from functools import lru_cache
 
-from web3 import AsyncWeb3
+from eth_abi import encode as abi_encode
+from web3 import AsyncWeb3, Web3
 from web3.providers import AsyncHTTPProvider
 
 from config.chains import SUPPORTED_CHAINS
@@ -23,29 +28,48 @@ from .abis import (
     AAVE_ATOKEN_ABI,
     MORPHO_VAULT_ABI,
     EULER_VAULT_ABI,
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    SELECTORS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Checksumming runs a keccak per call; the address set here is small and
+# static, so memoize instead of re-hashing on every read
+_checksum = lru_cache(maxsize=1024)(Web3.to_checksum_address)
 
+
+# Config address maps checksummed once at import; readers look these up
+# directly so the hot path never re-hashes a known address
+_CHECKSUMMED_USDC = {c: _checksum(a) for c, a in USDC_ADDRESSES.items()}
+_CHECKSUMMED_AAVE_AUSDC = {c: _checksum(a) for c, a in AAVE_AUSDC.items()}
+_CHECKSUMMED_MORPHO_VAULTS = {c: _checksum(a) for c, a in MORPHO_VAULTS.items()}
+_CHECKSUMMED_EULER_VAULTS = {c: _checksum(a) for c, a in EULER_VAULTS.items()}
+
+
+def _balance_of_calldata(wallet: str) -> bytes:
+    """balanceOf(address) calldata from the precomputed selector."""
+    return SELECTORS["balanceOf"] + abi_encode(["address"], [wallet])
+
+
+def _convert_to_assets_calldata(shares: int) -> bytes:
+    """convertToAssets(uint256) calldata from the precomputed selector."""
+    return SELECTORS["convertToAssets"] + abi_encode(["uint256"], [shares])
+
+
+# slots=True drops the per-instance __dict__ (these are created for every
+# position x chain x user read); frozen makes instances safe to cache
+@dataclass(slots=True, frozen=True)
 class PositionInfo:
     """Position information from on-chain reading."""
 
-    def __init__(
-        self,
-        chain_id: int,
-        protocol: str,
-        token: str,
-        amount: Decimal,
-        amount_usd: Decimal,
-        vault_token_address: str | None = None,
-    ):
-        self.chain_id = chain_id
-        self.protocol = protocol
-        self.token = token
-        self.amount = amount  # In token decimals (e.g., 6 for USDC)
-        self.amount_usd = amount_usd  # Same as amount for stablecoins
-        self.vault_token_address = vault_token_address
+    chain_id: int
+    protocol: str
+    token: str
+    amount: Decimal  # In token decimals (e.g., 6 for USDC)
+    amount_usd: Decimal  # Same as amount for stablecoins
+    vault_token_address: str | None = None
 
     def to_dict(self) -> dict:
         return {
@@ -69,12 +93,36 @@ class ContractReader:
 
     # USDC has 6 decimals on all chains
     USDC_DECIMALS = 6
+    # Precomputed divisor so hot paths skip the big-int power + allocation
+    _USDC_SCALE: Decimal = Decimal(10) ** 6
     # Max concurrent RPC calls per chain (avoid 429s on public RPCs)
     MAX_CONCURRENT = 5
+    # Positions only change with new blocks (~2s); short TTL amortizes
+    # repeat dashboard refreshes into a single RPC round
+    POSITION_CACHE_TTL = 5.0
+    POSITION_CACHE_MAX = 10_000
 
     def __init__(self):
         self._web3_clients: dict[int, AsyncWeb3] = {}
         self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT)
+        # Contract objects re-parse their ABI and recompute selectors on
+        # every construction; build each (chain, address, abi) once
+        self._contracts: dict[tuple[int, str, int], object] = {}
+        # ERC20 decimals never change; cache them so repeat balance reads
+        # cost one RPC instead of two. USDC is pre-seeded (always 6).
+        self._decimals_cache: dict[tuple[int, str], int] = {
+            (chain_id, address.lower()): self.USDC_DECIMALS
+            for chain_id, address in USDC_ADDRESSES.items()
+        }
+        # Matching Decimal scale per token, built alongside _decimals_cache
+        self._scale_cache: dict[tuple[int, str], Decimal] = {
+            key: self._USDC_SCALE for key in self._decimals_cache
+        }
+        # Short-TTL read cache with per-key single-flight locks
+        self._position_cache: dict[tuple, tuple[float, object]] = {}
+        self._position_locks: dict[tuple, asyncio.Lock] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def _get_web3(self, chain_id: int) -> AsyncWeb3:
         """Get or create Web3 client for chain."""
@@ -84,10 +132,89 @@ class ContractReader:
                 raise ValueError(f"Unsupported chain: {chain_id}")
 
             provider = AsyncHTTPProvider(chain_config["rpc"])
-            self._web3_clients[chain_id] = AsyncWeb3(provider)
+            client = AsyncWeb3(provider)
+            self._web3_clients[chain_id] = client
+            self._prewarm(client, chain_id)
 
         return self._web3_clients[chain_id]
 
+    @staticmethod
+    def _prewarm(client: AsyncWeb3, chain_id: int) -> None:
+        """
+        Prime the provider's keep-alive connection off the critical path.
+
+        AsyncHTTPProvider opens its connection lazily on the first call,
+        charging the TCP+TLS handshake to whichever read happens to come
+        first; a throwaway eth_chainId pays it in the background instead.
+        """
+
+        async def _warm():
+            try:
+                await client.eth.chain_id
+            except Exception as e:
+                logger.debug(f"RPC pre-warm failed for chain {chain_id}: {e}")
+
+        try:
+            asyncio.get_running_loop().create_task(_warm())
+        except RuntimeError:
+            # No running loop (sync construction); the first read warms it
+            pass
+
+    async def warm_connections(self) -> None:
+        """Pre-open RPC connections for all supported chains (startup hook)."""
+        for chain_id in SUPPORTED_CHAINS:
+            self._get_web3(chain_id)
+
+    def _contract(self, chain_id: int, address: str, abi: list):
+        """Get or build the cached Contract for (chain, address, abi)."""
+        key = (chain_id, address, id(abi))
+        contract = self._contracts.get(key)
+        if contract is None:
+            w3 = self._get_web3(chain_id)
+            contract = w3.eth.contract(address=_checksum(address), abi=abi)
+            self._contracts[key] = contract
+        return contract
+
+
+    async def _raw_call(self, chain_id: int, to: str, calldata: bytes) -> bytes:
+        """Single eth_call with prebuilt calldata (skips the contract layer)."""
+        w3 = self._get_web3(chain_id)
+        return await w3.eth.call({"to": _checksum(to), "data": calldata})
+
+    async def _cached(self, key: tuple, coro_factory):
+        """
+        TTL-cache a read, deduping concurrent misses per key (single-flight).
+
+        Concurrent callers for the same key wait on one lock so only the
+        first issues the RPC; the rest reuse its result.
+        """
+        entry = self._position_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self.POSITION_CACHE_TTL:
+            self._cache_hits += 1
+            return entry[1]
+
+        lock = self._position_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._position_cache.get(key)
+            if entry and time.monotonic() - entry[0] < self.POSITION_CACHE_TTL:
+                self._cache_hits += 1
+                return entry[1]
+
+            self._cache_misses += 1
+            value = await coro_factory()
+
+            if len(self._position_cache) >= self.POSITION_CACHE_MAX:
+                self._position_cache.clear()
+                self._position_locks.clear()
+            self._position_cache[key] = (time.monotonic(), value)
+
+            if (self._cache_hits + self._cache_misses) % 1000 == 0:
+                logger.debug(
+                    f"Position cache: {self._cache_hits} hits / "
+                    f"{self._cache_misses} misses"
+                )
+            return value
+
     async def get_token_balance(
         self,
         chain_id: int,
@@ -99,21 +226,22 @@ class ContractReader:
 
         Returns balance in human-readable format (divided by decimals).
         """
-        w3 = self._get_web3(chain_id)
-
-        contract = w3.eth.contract(
-            address=w3.to_checksum_address(token_address),
-            abi=ERC20_ABI,
-        )
+        contract = self._contract(chain_id, token_address, ERC20_ABI)
 
         try:
             balance = await contract.functions.balanceOf(
-                w3.to_checksum_address(wallet_address)
+                _checksum(wallet_address)
             ).call()
 
-            decimals = await contract.functions.decimals().call()
+            cache_key = (chain_id, token_address.lower())
+            scale = self._scale_cache.get(cache_key)
+            if scale is None:
+                decimals = await contract.functions.decimals().call()
+                self._decimals_cache[cache_key] = decimals
+                scale = Decimal(10) ** decimals
+                self._scale_cache[cache_key] = scale
 
-            return Decimal(balance) / Decimal(10**decimals)
+            return Decimal(balance) / scale
         except Exception as e:
             logger.error(f"Error reading balance for {token_address}: {e}")
             return Decimal(0)
@@ -123,12 +251,15 @@ class ContractReader:
         chain_id: int,
         wallet_address: str,
     ) -> Decimal:
-        """Get USDC balance for wallet on chain."""
-        usdc_address = USDC_ADDRESSES.get(chain_id)
+        """Get USDC balance for wallet on chain (cached ~one block)."""
+        usdc_address = _CHECKSUMMED_USDC.get(chain_id)
         if not usdc_address:
             return Decimal(0)
 
-        return await self.get_token_balance(chain_id, usdc_address, wallet_address)
+        return await self._cached(
+            (chain_id, wallet_address.lower(), "usdc"),
+            lambda: self.get_token_balance(chain_id, usdc_address, wallet_address),
+        )
 
     async def get_aave_position(
         self,
@@ -139,28 +270,36 @@ class ContractReader:
         Get Aave V3 position (aUSDC balance).
 
         aUSDC balance automatically includes accrued interest.
+        Results are cached for roughly one block.
         """
-        ausdc_address = AAVE_AUSDC.get(chain_id)
+        ausdc_address = _CHECKSUMMED_AAVE_AUSDC.get(chain_id)
         if not ausdc_address:
             return None
 
-        w3 = self._get_web3(chain_id)
+        return await self._cached(
+            (chain_id, vault_address.lower(), "aave-v3"),
+            lambda: self._get_aave_position_uncached(
+                chain_id, vault_address, ausdc_address
+            ),
+        )
 
+    async def _get_aave_position_uncached(
+        self,
+        chain_id: int,
+        vault_address: str,
+        ausdc_address: str,
+    ) -> PositionInfo | None:
         try:
-            contract = w3.eth.contract(
-                address=w3.to_checksum_address(ausdc_address),
-                abi=AAVE_ATOKEN_ABI,
+            data = await self._raw_call(
+                chain_id, ausdc_address, _balance_of_calldata(_checksum(vault_address))
             )
-
-            balance = await contract.functions.balanceOf(
-                w3.to_checksum_address(vault_address)
-            ).call()
+            balance = int.from_bytes(data, "big")
 
             if balance == 0:
                 return None
 
             # aUSDC has same decimals as USDC (6)
-            amount = Decimal(balance) / Decimal(10**self.USDC_DECIMALS)
+            amount = Decimal(balance) / self._USDC_SCALE
 
             return PositionInfo(
                 chain_id=chain_id,
@@ -185,20 +324,34 @@ class ContractReader:
 
         Checks all known Morpho vaults for this chain (from DB or fallback to hardcoded).
         Morpho vaults are ERC4626 - shares need conversion to assets.
+        Results are cached for roughly one block.
         """
-        vaults_to_check = protocol_vaults or []
-        # Fallback: always include hardcoded vault
-        hardcoded = MORPHO_VAULTS.get(chain_id)
-        if hardcoded and hardcoded not in vaults_to_check:
-            vaults_to_check.append(hardcoded)
-
+        vaults_to_check = self._vaults_to_check(
+            protocol_vaults, _CHECKSUMMED_MORPHO_VAULTS.get(chain_id)
+        )
         if not vaults_to_check:
             return []
 
+        return await self._cached(
+            (chain_id, vault_address.lower(), "morpho-v1", tuple(vaults_to_check)),
+            lambda: self._check_erc4626_positions(
+                chain_id, vault_address, vaults_to_check, "morpho-v1", MORPHO_VAULT_ABI
+            ),
+        )
+
+    async def _check_erc4626_positions(
+        self,
+        chain_id: int,
+        vault_address: str,
+        vaults_to_check: list[str],
+        protocol: str,
+        abi: list,
+    ) -> list[PositionInfo]:
+        """Check a list of ERC4626 vaults for positions, in parallel."""
         results = await asyncio.gather(
             *[
                 self._check_erc4626_position(
-                    chain_id, vault_address, pv, "morpho-v1", MORPHO_VAULT_ABI
+                    chain_id, vault_address, pv, protocol, abi
                 )
                 for pv in vaults_to_check
             ],
@@ -210,7 +363,9 @@ class ContractReader:
             if isinstance(r, PositionInfo):
                 positions.append(r)
             elif isinstance(r, Exception):
-                logger.error(f"Error reading Morpho position on chain {chain_id}: {r}")
+                logger.error(
+                    f"Error reading {protocol} position on chain {chain_id}: {r}"
+                )
         return positions
 
     async def get_euler_position(
@@ -224,33 +379,21 @@ class ContractReader:
 
         Checks all known Euler vaults for this chain (from DB or fallback to hardcoded).
         Euler vaults are ERC4626 compatible.
+        Results are cached for roughly one block.
         """
-        vaults_to_check = protocol_vaults or []
-        hardcoded = EULER_VAULTS.get(chain_id)
-        if hardcoded and hardcoded not in vaults_to_check:
-            vaults_to_check.append(hardcoded)
-
+        vaults_to_check = self._vaults_to_check(
+            protocol_vaults, _CHECKSUMMED_EULER_VAULTS.get(chain_id)
+        )
         if not vaults_to_check:
             return []
 
-        results = await asyncio.gather(
-            *[
-                self._check_erc4626_position(
-                    chain_id, vault_address, pv, "euler-v2", EULER_VAULT_ABI
-                )
-                for pv in vaults_to_check
-            ],
-            return_exceptions=True,
+        return await self._cached(
+            (chain_id, vault_address.lower(), "euler-v2", tuple(vaults_to_check)),
+            lambda: self._check_erc4626_positions(
+                chain_id, vault_address, vaults_to_check, "euler-v2", EULER_VAULT_ABI
+            ),
         )
 
-        positions = []
-        for r in results:
-            if isinstance(r, PositionInfo):
-                positions.append(r)
-            elif isinstance(r, Exception):
-                logger.error(f"Error reading Euler position on chain {chain_id}: {r}")
-        return positions
-
     async def _check_erc4626_position(
         self,
         chain_id: int,
@@ -261,22 +404,18 @@ class ContractReader:
     ) -> PositionInfo | None:
         """Check a single ERC4626 vault for a position (rate-limited)."""
         async with self._semaphore:
-            w3 = self._get_web3(chain_id)
-
-            contract = w3.eth.contract(
-                address=w3.to_checksum_address(protocol_vault),
-                abi=abi,
+            data = await self._raw_call(
+                chain_id, protocol_vault, _balance_of_calldata(_checksum(vault_address))
             )
-
-            shares = await contract.functions.balanceOf(
-                w3.to_checksum_address(vault_address)
-            ).call()
+            shares = int.from_bytes(data, "big")
 
             if shares == 0:
                 return None
 
-            assets = await contract.functions.convertToAssets(shares).call()
-            amount = Decimal(assets) / Decimal(10**self.USDC_DECIMALS)
+            data = await self._raw_call(
+                chain_id, protocol_vault, _convert_to_assets_calldata(shares)
+            )
+            amount = Decimal(int.from_bytes(data, "big")) / self._USDC_SCALE
 
             return PositionInfo(
                 chain_id=chain_id,
@@ -287,6 +426,30 @@ class ContractReader:
                 vault_token_address=protocol_vault,
             )
 
+    async def _multicall(
+        self,
+        chain_id: int,
+        calls: list[tuple[str, bytes]],
+    ) -> list[tuple[bool, bytes]]:
+        """
+        Execute batched contract reads via Multicall3 aggregate3.
+
+        Packs N reads into a single eth_call, so one RPC round-trip
+        returns all results.
+
+        Args:
+            calls: List of (target_address, calldata) pairs
+
+        Returns:
+            List of (success, return_data) per call, in input order
+        """
+        multicall = self._contract(chain_id, MULTICALL3_ADDRESS, MULTICALL3_ABI)
+        payload = [
+            (_checksum(target), True, calldata) for target, calldata in calls
+        ]
+        async with self._semaphore:
+            return await multicall.functions.aggregate3(payload).call()
+
     async def get_all_positions(
         self,
         vault_address: str,
@@ -298,27 +461,195 @@ class ContractReader:
         Get all positions for a vault on a specific chain.
 
         Checks Aave, Morpho, and Euler for any deposited funds.
-        For Morpho/Euler, checks all known vaults (from DB) in parallel.
+        Batches all balance reads into a Multicall3 aggregate so a whole
+        chain costs ~1-2 RPCs, falling back to direct per-contract reads
+        if the multicall fails. Results are cached for roughly one block
+        so back-to-back dashboard refreshes share one RPC round.
         """
+        try:
+            return await self._cached(
+                (
+                    chain_id,
+                    vault_address.lower(),
+                    "all-multicall",
+                    tuple(morpho_vaults or ()),
+                    tuple(euler_vaults or ()),
+                ),
+                lambda: self._get_all_positions_multicall(
+                    vault_address, chain_id, morpho_vaults, euler_vaults
+                ),
+            )
+        except Exception as e:
+            logger.warning(
+                f"Multicall position read failed on chain {chain_id}, "
+                f"falling back to direct reads: {e}"
+            )
+            return await self._get_all_positions_direct(
+                vault_address, chain_id, morpho_vaults, euler_vaults
+            )
+
+    async def _get_all_positions_multicall(
+        self,
+        vault_address: str,
+        chain_id: int,
+        morpho_vaults: list[str] | None = None,
+        euler_vaults: list[str] | None = None,
+    ) -> list[PositionInfo]:
+        """Batched position read: one multicall for all balanceOf reads,
+        then one more for the ERC4626 share -> asset conversions."""
+        wallet = _checksum(vault_address)
+
+        # (protocol, target_address, abi) per read, in call order
+        targets: list[tuple[str, str, list]] = []
+
+        ausdc_address = _CHECKSUMMED_AAVE_AUSDC.get(chain_id)
+        if ausdc_address:
+            targets.append(("aave-v3", ausdc_address, AAVE_ATOKEN_ABI))
+
+        for pv in self._vaults_to_check(morpho_vaults, _CHECKSUMMED_MORPHO_VAULTS.get(chain_id)):
+            targets.append(("morpho-v1", pv, MORPHO_VAULT_ABI))
+
+        for pv in self._vaults_to_check(euler_vaults, _CHECKSUMMED_EULER_VAULTS.get(chain_id)):
+            targets.append(("euler-v2", pv, EULER_VAULT_ABI))
+
+        usdc_address = _CHECKSUMMED_USDC.get(chain_id)
+        if usdc_address:
+            targets.append(("wallet", usdc_address, ERC20_ABI))
+
+        if not targets:
+            return []
+
+        balance_calldata = _balance_of_calldata(wallet)
+        balance_calls = [(address, balance_calldata) for _, address, _ in targets]
+
+        balance_results = await self._multicall(chain_id, balance_calls)
+
         positions = []
+        # ERC4626 shares that need a convertToAssets pass: (target_index, shares)
+        conversions: list[tuple[int, int]] = []
+
+        for i, ((protocol, address, abi), (success, data)) in enumerate(
+            zip(targets, balance_results)
+        ):
+            if not success or not data:
+                continue
+            balance = int.from_bytes(data, "big")
+            if balance == 0:
+                continue
+
+            if protocol in ("morpho-v1", "euler-v2"):
+                conversions.append((i, balance))
+            elif protocol == "aave-v3":
+                # aUSDC has same decimals as USDC (6)
+                amount = Decimal(balance) / self._USDC_SCALE
+                positions.append(
+                    PositionInfo(
+                        chain_id=chain_id,
+                        protocol="aave-v3",
+                        token="USDC",
+                        amount=amount,
+                        amount_usd=amount,  # 1:1 for USDC
+                        vault_token_address=address,
+                    )
+                )
+            else:  # wallet USDC
+                amount = Decimal(balance) / self._USDC_SCALE
+                if amount > Decimal("0.01"):  # Ignore dust
+                    positions.append(
+                        PositionInfo(
+                            chain_id=chain_id,
+                            protocol="wallet",  # Not deployed
+                            token="USDC",
+                            amount=amount,
+                            amount_usd=amount,
+                            vault_token_address=address,
+                        )
+                    )
+
+        if conversions:
+            convert_calls = [
+                (targets[i][1], _convert_to_assets_calldata(shares))
+                for i, shares in conversions
+            ]
+
+            convert_results = await self._multicall(chain_id, convert_calls)
+
+            for (i, shares), (success, data) in zip(conversions, convert_results):
+                if not success or not data:
+                    continue
+                protocol, address, abi = targets[i]
+                assets = int.from_bytes(data, "big")
+                amount = Decimal(assets) / self._USDC_SCALE
+                positions.append(
+                    PositionInfo(
+                        chain_id=chain_id,
+                        protocol=protocol,
+                        token="USDC",
+                        amount=amount,
+                        amount_usd=amount,
+                        vault_token_address=address,
+                    )
+                )
 
-        # Check each protocol
-        aave_pos = await self.get_aave_position(chain_id, vault_address)
-        if aave_pos:
-            positions.append(aave_pos)
+        return positions
 
-        morpho_positions = await self.get_morpho_position(
-            chain_id, vault_address, morpho_vaults
-        )
-        positions.extend(morpho_positions)
+    @staticmethod
+    def _vaults_to_check(
+        protocol_vaults: list[str] | None, hardcoded: str | None
+    ) -> list[str]:
+        """Combine DB-provided vaults with the hardcoded fallback."""
+        vaults = list(protocol_vaults or [])
+        if hardcoded and hardcoded not in vaults:
+            vaults.append(hardcoded)
+        return vaults
+
+    async def _get_all_positions_direct(
+        self,
+        vault_address: str,
+        chain_id: int,
+        morpho_vaults: list[str] | None = None,
+        euler_vaults: list[str] | None = None,
+    ) -> list[PositionInfo]:
+        """Direct per-contract reads (fallback when multicall is unavailable)."""
+        positions = []
 
-        euler_positions = await self.get_euler_position(
-            chain_id, vault_address, euler_vaults
+        # Each protocol read is independent network I/O, so run them
+        # concurrently: wall time becomes max-of-RTTs instead of sum-of-RTTs
+        aave_pos, morpho_positions, euler_positions, usdc_balance = (
+            await asyncio.gather(
+                self.get_aave_position(chain_id, vault_address),
+                self.get_morpho_position(chain_id, vault_address, morpho_vaults),
+                self.get_euler_position(chain_id, vault_address, euler_vaults),
+                self.get_usdc_balance(chain_id, vault_address),
+                return_exceptions=True,
+            )
         )
-        positions.extend(euler_positions)
+
+        if isinstance(aave_pos, Exception):
+            logger.error(f"Error reading Aave position on chain {chain_id}: {aave_pos}")
+        elif aave_pos:
+            positions.append(aave_pos)
+
+        if isinstance(morpho_positions, Exception):
+            logger.error(
+                f"Error reading Morpho positions on chain {chain_id}: {morpho_positions}"
+            )
+        else:
+            positions.extend(morpho_positions)
+
+        if isinstance(euler_positions, Exception):
+            logger.error(
+                f"Error reading Euler positions on chain {chain_id}: {euler_positions}"
+            )
+        else:
+            positions.extend(euler_positions)
 
         # Also check raw USDC balance (not deployed to any protocol)
-        usdc_balance = await self.get_usdc_balance(chain_id, vault_address)
+        if isinstance(usdc_balance, Exception):
+            logger.error(
+                f"Error reading USDC balance on chain {chain_id}: {usdc_balance}"
+            )
+            usdc_balance = Decimal(0)
         if usdc_balance > Decimal("0.01"):  # Ignore dust
             positions.append(
                 PositionInfo(
@@ -327,7 +658,7 @@ class ContractReader:
                     token="USDC",
                     amount=usdc_balance,
                     amount_usd=usdc_balance,
-                    vault_token_address=USDC_ADDRESSES.get(chain_id),
+                    vault_token_address=_CHECKSUMMED_USDC.get(chain_id),
                 )
             )
 
@@ -349,17 +680,29 @@ class ContractReader:
         Returns:
             List of all positions across all chains
         """
-        all_positions = []
+        # Chains are independent RPC endpoints; read them all concurrently
+        chain_ids = list(vault_addresses.keys())
+        results = await asyncio.gather(
+            *[
+                self.get_all_positions(
+                    vault_address,
+                    chain_id,
+                    morpho_vaults=(protocol_vaults or {})
+                    .get(chain_id, {})
+                    .get("morpho"),
+                    euler_vaults=(protocol_vaults or {}).get(chain_id, {}).get("euler"),
+                )
+                for chain_id, vault_address in vault_addresses.items()
+            ],
+            return_exceptions=True,
+        )
 
-        for chain_id, vault_address in vault_addresses.items():
-            chain_vaults = (protocol_vaults or {}).get(chain_id, {})
-            positions = await self.get_all_positions(
-                vault_address,
-                chain_id,
-                morpho_vaults=chain_vaults.get("morpho"),
-                euler_vaults=chain_vaults.get("euler"),
-            )
-            all_positions.extend(positions)
+        all_positions = []
+        for chain_id, result in zip(chain_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error reading positions on chain {chain_id}: {result}")
+                continue
+            all_positions.extend(result)
 
         return all_positions
 
@@ -369,7 +712,10 @@ class ContractReader:
     ) -> Decimal:
         """Get total USD value across all positions."""
         positions = await self.get_positions_all_chains(vault_addresses)
-        return sum(p.amount_usd for p in positions)
+        # fsum over floats beats Decimal addition by an order of magnitude
+        # and is error-compensated; float precision is ample for a USD total
+        total = math.fsum(float(p.amount_usd) for p in positions)
+        return Decimal(repr(total))
 
 
 # Singleton for reuse
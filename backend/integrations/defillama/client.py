@@ -4,15 +4,35 @@ DeFiLlama client for fetching yield/APY data.
 API: https://yields.llama.fi
 """
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 from config.protocols import SUPPORTED_PROTOCOLS, PROTOCOL_RISK_SCORES
 from integrations.base import BaseAsyncClient
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
 
+class _AsyncStreamReader:
+    """Adapt an httpx byte iterator to the async file API ijson expects."""
+
+    def __init__(self, byte_iterator):
+        self._byte_iterator = byte_iterator
+
+    async def read(self, size: int = -1) -> bytes:
+        try:
+            return await self._byte_iterator.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
 # Mapping from DeFiLlama chain names to our chain IDs
 DEFILLAMA_CHAIN_MAP = {
     "base": 8453,
@@ -23,6 +43,10 @@ DEFILLAMA_CHAIN_MAP = {
 # Minimum TVL for pools to be considered ($100k)
 MIN_TVL_USD = 100_000
 
+# Frozen lookup sets for the filter hot loop (O(1) membership, built once)
+_SUPPORTED_PROTOCOLS = frozenset(SUPPORTED_PROTOCOLS)
+_CHAIN_KEYS = frozenset(DEFILLAMA_CHAIN_MAP)
+
 
 class DeFiLlamaClient(BaseAsyncClient):
     """
@@ -33,16 +57,54 @@ class DeFiLlamaClient(BaseAsyncClient):
 
     BASE_URL = "https://yields.llama.fi"
     DEFAULT_TIMEOUT = 60.0  # DeFiLlama can be slow
+    # /pools is a multi-MB payload that only changes over minutes; share
+    # one response across callers for this long
+    POOLS_CACHE_TTL = 60.0
+
+    _pools_cache: tuple[float, list[dict[str, Any]]] | None = None
+    _pools_lock: asyncio.Lock = asyncio.Lock()
 
     async def get_pools(self) -> list[dict[str, Any]]:
         """
-        Fetch all pools from DeFiLlama.
+        Fetch all pools from DeFiLlama (cached for POOLS_CACHE_TTL seconds).
 
         Returns:
             List of pool data dicts
         """
-        response = await self._get("/pools")
-        return response.get("data", [])
+        cached = DeFiLlamaClient._pools_cache
+        if cached and time.monotonic() - cached[0] < self.POOLS_CACHE_TTL:
+            return cached[1]
+
+        # Double-checked locking: only one coroutine fetches under a
+        # thundering herd, the rest reuse its result
+        async with DeFiLlamaClient._pools_lock:
+            cached = DeFiLlamaClient._pools_cache
+            if cached and time.monotonic() - cached[0] < self.POOLS_CACHE_TTL:
+                return cached[1]
+
+            if ijson is not None:
+                pools = await self._stream_pools()
+            else:
+                response = await self._get("/pools")
+                pools = response.get("data", [])
+            DeFiLlamaClient._pools_cache = (time.monotonic(), pools)
+            return pools
+
+    async def _stream_pools(self) -> list[dict[str, Any]]:
+        """
+        Stream-parse /pools with ijson.
+
+        Builds pool dicts incrementally from the wire instead of buffering
+        the multi-MB response body and its full JSON document at once,
+        roughly halving peak memory for the fetch.
+        """
+        pools: list[dict[str, Any]] = []
+        async with self.client.stream("GET", "/pools") as response:
+            response.raise_for_status()
+            reader = _AsyncStreamReader(response.aiter_bytes())
+            async for pool in ijson.items_async(reader, "data.item"):
+                pools.append(pool)
+        return pools
 
     def filter_supported_pools(
         self, pools: list[dict[str, Any]]
@@ -65,73 +127,79 @@ class DeFiLlamaClient(BaseAsyncClient):
         filtered = []
 
         for pool in pools:
-            # Check chain
-            chain = pool.get("chain", "").lower()
-            if chain not in DEFILLAMA_CHAIN_MAP:
+            # Cheapest predicates first: numeric compare, then bool flag,
+            # then the string allocations for chain/project/symbol
+            tvl = pool.get("tvlUsd", 0)
+            if tvl < MIN_TVL_USD:
                 continue
 
-            # Check protocol
-            project = pool.get("project", "").lower()
-            if project not in SUPPORTED_PROTOCOLS:
+            if not pool.get("stablecoin", False):
                 continue
 
-            # Check symbol (must be USDC)
-            symbol = pool.get("symbol", "").upper()
-            if "USDC" not in symbol:
+            chain = pool.get("chain", "").lower()
+            if chain not in _CHAIN_KEYS:
                 continue
 
-            # Check stablecoin flag
-            if not pool.get("stablecoin", False):
+            project = pool.get("project", "").lower()
+            if project not in _SUPPORTED_PROTOCOLS:
                 continue
 
-            # Check TVL
-            tvl = pool.get("tvlUsd", 0)
-            if tvl < MIN_TVL_USD:
+            # Check symbol (must be USDC)
+            if "USDC" not in pool.get("symbol", "").upper():
                 continue
 
-            # Add chain_id and risk score
-            pool_data = {
-                **pool,
-                "chain_id": DEFILLAMA_CHAIN_MAP[chain],
-                "risk_score": self._calculate_risk_score(pool),
-            }
+            # Annotate in place rather than copying the whole pool dict
+            pool["chain_id"] = DEFILLAMA_CHAIN_MAP[chain]
+            filtered.append(pool)
 
-            filtered.append(pool_data)
+        # Score in one tight batch pass instead of per-pool method calls
+        self._score_pools(filtered)
 
         logger.info(f"Filtered {len(filtered)} pools from {len(pools)} total")
         return filtered
 
-    def _calculate_risk_score(self, pool: dict[str, Any]) -> int:
+    @staticmethod
+    def _score_pools(pools: list[dict[str, Any]]) -> None:
         """
-        Calculate risk score for a pool (1-10, lower is safer).
+        Annotate each pool with a risk score (1-10, lower is safer), in place.
 
         Factors:
         - Protocol base risk
         - TVL (higher = safer)
         - IL risk
         - Exposure type
+
+        Lookups are bound to locals so the loop body is pure arithmetic
+        plus dict access - no attribute resolution per pool.
         """
-        project = pool.get("project", "").lower()
-        base_score = PROTOCOL_RISK_SCORES.get(project, 5)
+        risk_get = PROTOCOL_RISK_SCORES.get
 
-        # Adjust for TVL (higher TVL = lower risk)
-        tvl = pool.get("tvlUsd", 0)
-        if tvl > 100_000_000:  # $100M+
-            base_score = max(1, base_score - 1)
-        elif tvl < 1_000_000:  # <$1M
-            base_score = min(10, base_score + 1)
+        for pool in pools:
+            get = pool.get
+            score = risk_get(get("project", "").lower(), 5)
+
+            # Adjust for TVL (higher TVL = lower risk)
+            tvl = get("tvlUsd", 0)
+            if tvl > 100_000_000:  # $100M+
+                score -= 1
+            elif tvl < 1_000_000:  # <$1M
+                score += 1
 
-        # Adjust for IL risk
-        il_risk = pool.get("ilRisk", "none")
-        if il_risk == "yes" or il_risk == "high":
-            base_score = min(10, base_score + 2)
+            # Adjust for IL risk
+            if get("ilRisk", "none") in ("yes", "high"):
+                score += 2
 
-        # Adjust for exposure type
-        exposure = pool.get("exposure", "single")
-        if exposure == "multi":
-            base_score = min(10, base_score + 1)
+            # Adjust for exposure type
+            if get("exposure", "single") == "multi":
+                score += 1
 
-        return base_score
+            # Clamp to the 1-10 scale once, at the end
+            pool["risk_score"] = 1 if score < 1 else 10 if score > 10 else score
+
+    def _calculate_risk_score(self, pool: dict[str, Any]) -> int:
+        """Calculate risk score for a single pool (see _score_pools)."""
+        self._score_pools([pool])
+        return pool.pop("risk_score")
 
     async def get_filtered_pools(self) -> list[dict[str, Any]]:
         """
@@ -154,3 +222,28 @@ def get_defillama_client() -> DeFiLlamaClient:
     if _client is None:
         _client = DeFiLlamaClient()
     return _client
+
+
+async def warm_clients() -> None:
+    """
+    Eagerly open shared HTTP pools so the first caller skips setup.
+
+    Touching ``client`` builds the pooled httpx.AsyncClient (TLS handshake
+    still happens on the first request, but against a warm pool); the
+    reader warm-up primes one RPC connection per supported chain. Meant to
+    be called once from the ASGI lifespan startup hook.
+    """
+    client = get_defillama_client()
+    _ = client.client
+
+    from integrations.contracts.reader import get_contract_reader
+
+    await get_contract_reader().warm_connections()
+
+
+async def close_clients() -> None:
+    """Close the shared HTTP pools cleanly on process shutdown."""
+    from integrations.defillama.vault_resolver import close_resolver_client
+
+    await get_defillama_client().close()
+    await close_resolver_client()
@@ -10,21 +10,41 @@ Resolves DeFiLlama pool entries to on-chain vault contract addresses:
 
 import asyncio
 import logging
+import random
+from collections import defaultdict
+from itertools import chain
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+    wait_exponential_jitter,
+    retry_if_exception,
 )
 
+from django.core.cache import cache
+
 from config.protocols import USDC_ADDRESSES
+from integrations.base import _get_shared_client
 
 logger = logging.getLogger(__name__)
 
 MORPHO_GRAPHQL_URL = "https://api.morpho.org/graphql"
 
+# Resolved mappings persisted in Redis so a process restart inside the TTL
+# window costs one cache GET instead of a multi-MB GraphQL refetch
+MORPHO_CACHE_KEY = "morpho:vaults:v2"
+EULER_CACHE_KEY = "euler:vaults:{chain_id}"
+VAULT_CACHE_TTL = 1800  # vault lists change slowly; 30 min staleness is fine
+
+# Static filters materialized once at import instead of per invocation
+USDC_SET: frozenset[str] = frozenset(a.lower() for a in USDC_ADDRESSES.values())
+SUPPORTED_CHAIN_IDS: frozenset[int] = frozenset(USDC_ADDRESSES)
+_USDC_LOWER_BY_CHAIN: dict[int, str] = {
+    c: a.lower() for c, a in USDC_ADDRESSES.items()
+}
+
 EULER_GOLDSKY_ENDPOINTS: dict[int, str] = {
     8453: (
         "https://api.goldsky.com/api/public/"
@@ -36,6 +56,90 @@ EULER_GOLDSKY_ENDPOINTS: dict[int, str] = {
     ),
 }
 
+# Pool config for vault-resolver calls; a per-call AsyncClient pays a
+# fresh TCP+TLS handshake on every refresh
+_HTTP_TIMEOUT = 30.0
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _http() -> httpx.AsyncClient:
+    """Pooled resolver client, scoped to the running event loop.
+
+    These fetchers run via asyncio.run() from Celery tasks, so a
+    process-global client would hand one loop's keepalive connections to
+    the next ("Event loop is closed"); the shared helper keys its pools
+    per running loop.
+    """
+    return _get_shared_client("", _HTTP_TIMEOUT, {}, _HTTP_LIMITS)
+
+
+async def close_resolver_client() -> None:
+    """Close the shared resolver HTTP pool (process shutdown hook)."""
+    client = _http()
+    if not client.is_closed:
+        await client.aclose()
+
+
+# Cap on how long we honor a server-provided Retry-After header
+RETRY_AFTER_CAP = 30.0
+
+# Rolling failure rate per host (EWMA); used to stretch the backoff window
+# while a peer is visibly degraded instead of hammering it on a fixed
+# schedule
+_EWMA_ALPHA = 0.2
+_BACKOFF_STRETCH = 10.0
+_host_failure: dict[str, float] = {}
+
+
+def _record_outcome(host: str, ok: bool) -> None:
+    """Fold one request outcome into the host's failure-rate EWMA."""
+    prev = _host_failure.get(host, 0.0)
+    _host_failure[host] = prev * (1 - _EWMA_ALPHA) + (0.0 if ok else _EWMA_ALPHA)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry on transport errors and rate-limit/overload status codes."""
+    if isinstance(exc, (httpx.TimeoutException, httpx.NetworkError)):
+        return True
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in (
+        429,
+        503,
+    )
+
+
+async def _respect_rate_limit(response: httpx.Response, host: str) -> None:
+    """Sleep out a 429/503 before the retry policy re-fires."""
+    if response.status_code not in (429, 503):
+        return
+
+    header = response.headers.get("Retry-After") or response.headers.get(
+        "X-RateLimit-Reset"
+    )
+    try:
+        delay = float(header) if header else 0.0
+    except ValueError:
+        delay = 0.0
+
+    # Widen the window while the host's rolling error rate is elevated
+    delay += _host_failure.get(host, 0.0) * _BACKOFF_STRETCH + random.uniform(0, 1)
+    await asyncio.sleep(min(delay, RETRY_AFTER_CAP))
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=1, max=10, jitter=2),
+    retry=retry_if_exception(_is_retryable),
+)
+async def _post_graphql(url: str, payload: dict) -> httpx.Response:
+    """POST a GraphQL document with rate-limit-aware retries."""
+    host = httpx.URL(url).host
+    response = await _http().post(url, json=payload)
+    _record_outcome(host, response.status_code < 400)
+    await _respect_rate_limit(response, host)
+    response.raise_for_status()
+    return response
+
+
 # Euler: (vault_name, chain_id) -> vault_address
 VaultMapping = dict[tuple[str, int], str]
 
@@ -56,30 +160,35 @@ async def fetch_morpho_vault_mapping() -> MorphoVaultMapping:
         When a symbol is unique on a chain, the list has one entry.
         When duplicates exist, the caller matches by TVL proximity to DeFiLlama.
     """
-    usdc_set = {addr.lower() for addr in USDC_ADDRESSES.values()}
+    cached = await asyncio.to_thread(cache.get, MORPHO_CACHE_KEY)
+    if cached is not None:
+        return cached
+
     supported_chain_ids = list(USDC_ADDRESSES.keys())
 
-    v1_query = """
-    query($chains: [Int!]) {
-      vaults(first: 1000, where: { chainId_in: $chains }) {
+    # Both vault generations in one aliased document: a single HTTP
+    # round-trip instead of two parallel POSTs. The USDC asset filter runs
+    # server-side, so the response only carries fields we actually use.
+    query = """
+    query($chains: [Int!], $usdc: [String!]) {
+      v1: vaults(
+        first: 1000
+        where: { chainId_in: $chains, assetAddress_in: $usdc }
+      ) {
         items {
           address
           symbol
-          asset { address }
           chain { id }
           state { totalAssetsUsd }
         }
       }
-    }
-    """
-
-    v2_query = """
-    query($chains: [Int!]) {
-      vaultV2s(first: 1000, where: { chainId_in: $chains }) {
+      v2: vaultV2s(
+        first: 1000
+        where: { chainId_in: $chains, assetAddress_in: $usdc }
+      ) {
         items {
           address
           symbol
-          asset { address }
           chain { id }
           totalAssetsUsd
         }
@@ -87,35 +196,33 @@ async def fetch_morpho_vault_mapping() -> MorphoVaultMapping:
     }
     """
 
-    variables = {"chains": supported_chain_ids}
+    variables = {
+        "chains": supported_chain_ids,
+        "usdc": list(USDC_ADDRESSES.values()),
+    }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        r1, r2 = await asyncio.gather(
-            client.post(
-                MORPHO_GRAPHQL_URL, json={"query": v1_query, "variables": variables}
-            ),
-            client.post(
-                MORPHO_GRAPHQL_URL, json={"query": v2_query, "variables": variables}
-            ),
-        )
-        r1.raise_for_status()
-        r2.raise_for_status()
+    resp = await _post_graphql(
+        MORPHO_GRAPHQL_URL, {"query": query, "variables": variables}
+    )
 
-    v1_items = r1.json().get("data", {}).get("vaults", {}).get("items", [])
-    v2_items = r2.json().get("data", {}).get("vaultV2s", {}).get("items", [])
-    all_items = v1_items + v2_items
+    # orjson decodes the ~1000-item payload several times faster than the
+    # stdlib json behind response.json()
+    data = orjson.loads(resp.content).get("data", {}) or {}
+    v1_items = (data.get("v1") or {}).get("items", [])
+    v2_items = (data.get("v2") or {}).get("items", [])
 
     logger.info(f"Morpho: Fetched {len(v1_items)} V1 + {len(v2_items)} V2 vaults")
 
-    mapping: MorphoVaultMapping = {}
+    # Single streamed pass over both generations; chain() avoids
+    # materializing a concatenated list and defaultdict drops the
+    # per-item setdefault allocation
+    mapping: MorphoVaultMapping = defaultdict(list)
+    in_supported = SUPPORTED_CHAIN_IDS.__contains__
 
-    for vault in all_items:
+    for vault in chain(v1_items, v2_items):
+        # Defensive: the server already filtered by chain and asset
         chain_id = vault.get("chain", {}).get("id")
-        asset_addr = vault.get("asset", {}).get("address", "").lower()
-
-        if chain_id not in supported_chain_ids:
-            continue
-        if asset_addr not in usdc_set:
+        if not in_supported(chain_id):
             continue
 
         symbol = vault.get("symbol", "")
@@ -130,9 +237,9 @@ async def fetch_morpho_vault_mapping() -> MorphoVaultMapping:
             or vault.get("totalAssetsUsd")
             or 0
         )
-        tvl = float(tvl)
-        key = (symbol.upper(), chain_id)
-        mapping.setdefault(key, []).append((address, tvl))
+        mapping[(symbol.upper(), chain_id)].append((address, float(tvl)))
+
+    mapping = dict(mapping)
 
     total_unique = sum(1 for v in mapping.values() if len(v) == 1)
     total_dupes = sum(1 for v in mapping.values() if len(v) > 1)
@@ -141,17 +248,18 @@ async def fetch_morpho_vault_mapping() -> MorphoVaultMapping:
         f"Morpho: Resolved {len(mapping)} USDC vault symbols "
         f"({total_unique} unique, {total_dupes} with duplicates)"
     )
+    await asyncio.to_thread(cache.set, MORPHO_CACHE_KEY, mapping, VAULT_CACHE_TTL)
     return mapping
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
-    retry=retry_if_exception_type((httpx.TimeoutException, httpx.NetworkError)),
-)
 async def _fetch_euler_chain(chain_id: int, endpoint: str) -> VaultMapping:
     """Fetch Euler USDC vaults from Goldsky subgraph for one chain."""
-    usdc_addr = USDC_ADDRESSES.get(chain_id, "").lower()
+    cache_key = EULER_CACHE_KEY.format(chain_id=chain_id)
+    cached = await asyncio.to_thread(cache.get, cache_key)
+    if cached is not None:
+        return cached
+
+    usdc_addr = _USDC_LOWER_BY_CHAIN.get(chain_id, "")
 
     query = """
     query {
@@ -164,10 +272,8 @@ async def _fetch_euler_chain(chain_id: int, endpoint: str) -> VaultMapping:
     }
     """
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(endpoint, json={"query": query})
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _post_graphql(endpoint, {"query": query})
+    data = orjson.loads(resp.content)
 
     vaults = data.get("data", {}).get("eulerVaults", [])
 
@@ -185,6 +291,7 @@ async def _fetch_euler_chain(chain_id: int, endpoint: str) -> VaultMapping:
         mapping[(name, chain_id)] = address
 
     logger.info(f"Euler: Resolved {len(mapping)} USDC vaults on chain {chain_id}")
+    await asyncio.to_thread(cache.set, cache_key, mapping, VAULT_CACHE_TTL)
     return mapping
 
 
@@ -196,14 +303,19 @@ async def fetch_euler_vault_mapping() -> VaultMapping:
         Mapping of (vault_name, chain_id) -> vault_address.
         Vault name matches DeFiLlama's poolMeta field (e.g. "EVK Vault eUSDC-5").
     """
-    tasks = [_fetch_euler_chain(cid, ep) for cid, ep in EULER_GOLDSKY_ENDPOINTS.items()]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
     combined: VaultMapping = {}
-    for result in results:
-        if isinstance(result, Exception):
-            logger.error(f"Euler vault fetch failed: {result}")
-            continue
-        combined.update(result)
+
+    async def _fetch_into(chain_id: int, endpoint: str) -> None:
+        # Per-chain failures are logged but don't doom the other chains
+        try:
+            combined.update(await _fetch_euler_chain(chain_id, endpoint))
+        except Exception as e:
+            logger.error(f"Euler vault fetch failed for chain {chain_id}: {e}")
+
+    # TaskGroup cancels siblings on teardown, so a shutdown mid-refresh
+    # doesn't leave orphaned requests in flight
+    async with asyncio.TaskGroup() as tg:
+        for cid, ep in EULER_GOLDSKY_ENDPOINTS.items():
+            tg.create_task(_fetch_into(cid, ep))
 
     return combined
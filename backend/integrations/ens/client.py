@@ -5,14 +5,71 @@ ENS is read from Ethereum mainnet using web3.py AsyncWeb3.
 """
 
 import logging
+import time
+from functools import lru_cache
 from typing import Any
 
 from django.conf import settings
+from ens import ENS
+from eth_abi import encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector
 from web3 import AsyncWeb3
 from web3.providers import AsyncHTTPProvider
 
+from integrations.contracts.abis import MULTICALL3_ABI, MULTICALL3_ADDRESS
+
 logger = logging.getLogger(__name__)
 
+# Namehash is a deterministic keccak chain (pure CPU); memoize it per name
+# so warm-cache runs hash each name once
+_namehash = lru_cache(maxsize=10_000)(ENS.namehash)
+
+_TEXT_SELECTOR = function_signature_to_4byte_selector("text(bytes32,string)")
+
+_VALID_RISK = frozenset(("low", "medium", "high"))
+
+
+def _parse_apy(preferences: dict[str, Any], value: str) -> None:
+    try:
+        preferences["min_apy"] = float(value)
+    except ValueError:
+        logger.warning(f"Invalid minAPY value: {value}")
+
+
+def _parse_risk(preferences: dict[str, Any], value: str) -> None:
+    value_lower = value.lower()
+    if value_lower in _VALID_RISK:
+        preferences["max_risk"] = value_lower
+    else:
+        logger.warning(f"Invalid maxRisk value: {value}")
+
+
+def _parse_chains(preferences: dict[str, Any], value: str) -> None:
+    # Parse comma-separated list
+    preferences["chains"] = [c.strip().lower() for c in value.split(",") if c.strip()]
+
+
+def _parse_protocols(preferences: dict[str, Any], value: str) -> None:
+    # Parse comma-separated list
+    preferences["protocols"] = [
+        p.strip().lower() for p in value.split(",") if p.strip()
+    ]
+
+
+def _parse_auto_rebalance(preferences: dict[str, Any], value: str) -> None:
+    preferences["auto_rebalance"] = value.lower() in ("true", "1", "yes")
+
+
+# key -> handler: O(1) dispatch instead of re-walking an if/elif chain for
+# every record of every wallet
+_PREFERENCE_HANDLERS = {
+    "yield.minAPY": _parse_apy,
+    "yield.maxRisk": _parse_risk,
+    "yield.chains": _parse_chains,
+    "yield.protocols": _parse_protocols,
+    "yield.autoRebalance": _parse_auto_rebalance,
+}
+
 
 class ENSClient:
     """
@@ -34,6 +91,12 @@ class ENSClient:
         "yield.autoRebalance",
     ]
 
+    # Resolvers practically never change; an hour of staleness is fine
+    RESOLVER_CACHE_TTL = 3600.0
+
+    # ERC-165 interface id for text(bytes32,string) (ITextResolver)
+    TEXT_INTERFACE_ID = bytes.fromhex("59d1d43c")
+
     def __init__(self, rpc_url: str | None = None):
         """
         Initialize ENS client.
@@ -43,6 +106,13 @@ class ENSClient:
         """
         self.rpc_url = rpc_url or settings.ETHEREUM_RPC_URL
         self._web3: AsyncWeb3 | None = None
+        self._multicall = None
+        # name -> (resolver contract, fetched_at); saves one registry RPC
+        # per preference fetch during warm-cache runs
+        self._resolver_cache: dict[str, tuple[Any, float]] = {}
+        # resolver address -> supports text(); ERC-165 support is static,
+        # so no TTL is needed
+        self._text_support: dict[str, bool] = {}
 
     @property
     def web3(self) -> AsyncWeb3:
@@ -51,6 +121,46 @@ class ENSClient:
             self._web3 = AsyncWeb3(AsyncHTTPProvider(self.rpc_url))
         return self._web3
 
+    @property
+    def multicall(self):
+        """Get the mainnet Multicall3 contract (built once)."""
+        if self._multicall is None:
+            self._multicall = self.web3.eth.contract(
+                address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+            )
+        return self._multicall
+
+    async def _get_resolver(self, ens_name: str):
+        """Get the resolver contract for a name, cached with a TTL."""
+        entry = self._resolver_cache.get(ens_name)
+        if entry and time.monotonic() - entry[1] < self.RESOLVER_CACHE_TTL:
+            return entry[0]
+
+        resolver = await self.web3.eth.ens.resolver(ens_name)
+        self._resolver_cache[ens_name] = (resolver, time.monotonic())
+        return resolver
+
+    async def _supports_text(self, resolver) -> bool:
+        """Check (and cache) whether a resolver implements text records."""
+        address = resolver.address
+        cached = self._text_support.get(address)
+        if cached is not None:
+            return cached
+
+        try:
+            supported = bool(
+                await resolver.functions.supportsInterface(
+                    self.TEXT_INTERFACE_ID
+                ).call()
+            )
+        except Exception as e:
+            logger.debug(f"supportsInterface check failed for {address}: {e}")
+            # Assume support; worst case the text calls fail as before
+            supported = True
+
+        self._text_support[address] = supported
+        return supported
+
     async def resolve_address(self, ens_name: str) -> str | None:
         """
         Resolve ENS name to address.
@@ -98,13 +208,13 @@ class ENSClient:
         """
         try:
             # Get resolver for the ENS name
-            resolver = await self.web3.eth.ens.resolver(ens_name)
+            resolver = await self._get_resolver(ens_name)
             if not resolver:
                 return None
 
             # Get text record
             value = await resolver.functions.text(
-                self.web3.eth.ens.namehash(ens_name),
+                _namehash(ens_name),
                 key,
             ).call()
 
@@ -139,28 +249,80 @@ class ENSClient:
         }
 
         try:
-            # Get resolver once for efficiency
-            resolver = await self.web3.eth.ens.resolver(ens_name)
+            # Get resolver once for efficiency (TTL-cached across calls)
+            resolver = await self._get_resolver(ens_name)
             if not resolver:
                 logger.debug(f"No resolver found for {ens_name}")
                 return preferences
 
-            namehash = self.web3.eth.ens.namehash(ens_name)
+            # Legacy resolvers without text() would revert every read;
+            # one cached ERC-165 probe skips them entirely
+            if not await self._supports_text(resolver):
+                logger.debug(f"Resolver for {ens_name} has no text record support")
+                return preferences
+
+            namehash = _namehash(ens_name)
 
-            # Fetch all text records
-            for key in self.TEXT_RECORDS:
+            # Pack all five text() reads into one Multicall3 aggregate3, so
+            # a preference fetch costs 1 RPC round-trip instead of 5
+            try:
+                calls = [
+                    (
+                        resolver.address,
+                        True,  # allowFailure: a missing record shouldn't revert the rest
+                        _TEXT_SELECTOR + namehash + tail,
+                    )
+                    for _, tail in _TEXT_CALL_TAILS
+                ]
+                results = await self.multicall.functions.aggregate3(calls).call()
+            except Exception as e:
+                logger.debug(
+                    f"Multicall text read failed for {ens_name}, "
+                    f"falling back to sequential reads: {e}"
+                )
+                await self._get_preferences_sequential(
+                    resolver, namehash, ens_name, preferences
+                )
+                return preferences
+
+            for key, (success, data) in zip(self.TEXT_RECORDS, results):
+                if not success or not data:
+                    continue
                 try:
-                    value = await resolver.functions.text(namehash, key).call()
-                    if value:
-                        self._parse_preference(preferences, key, value)
+                    (value,) = self.web3.codec.decode(["string"], data)
                 except Exception as e:
-                    logger.debug(f"Failed to get {key} for {ens_name}: {e}")
+                    logger.debug(f"Failed to decode {key} for {ens_name}: {e}")
+                    continue
+                if value:
+                    self._parse_preference(preferences, key, value)
 
         except Exception as e:
             logger.warning(f"Failed to get preferences for {ens_name}: {e}")
 
         return preferences
 
+    async def _get_preferences_sequential(
+        self,
+        resolver,
+        namehash: bytes,
+        ens_name: str,
+        preferences: dict[str, Any],
+    ) -> None:
+        """Fetch text records one call at a time (multicall fallback)."""
+        for key, tail in _TEXT_CALL_TAILS:
+            try:
+                data = await self.web3.eth.call(
+                    {
+                        "to": resolver.address,
+                        "data": _TEXT_SELECTOR + namehash + tail,
+                    }
+                )
+                (value,) = self.web3.codec.decode(["string"], data)
+                if value:
+                    self._parse_preference(preferences, key, value)
+            except Exception as e:
+                logger.debug(f"Failed to get {key} for {ens_name}: {e}")
+
     def _parse_preference(
         self,
         preferences: dict[str, Any],
@@ -168,31 +330,19 @@ class ENSClient:
         value: str,
     ) -> None:
         """Parse a single preference value into the preferences dict."""
-        if key == "yield.minAPY":
-            try:
-                preferences["min_apy"] = float(value)
-            except ValueError:
-                logger.warning(f"Invalid minAPY value: {value}")
-
-        elif key == "yield.maxRisk":
-            value_lower = value.lower()
-            if value_lower in ["low", "medium", "high"]:
-                preferences["max_risk"] = value_lower
-            else:
-                logger.warning(f"Invalid maxRisk value: {value}")
-
-        elif key == "yield.chains":
-            # Parse comma-separated list
-            chains = [c.strip().lower() for c in value.split(",") if c.strip()]
-            preferences["chains"] = chains
-
-        elif key == "yield.protocols":
-            # Parse comma-separated list
-            protocols = [p.strip().lower() for p in value.split(",") if p.strip()]
-            preferences["protocols"] = protocols
-
-        elif key == "yield.autoRebalance":
-            preferences["auto_rebalance"] = value.lower() in ["true", "1", "yes"]
+        handler = _PREFERENCE_HANDLERS.get(key)
+        if handler:
+            handler(preferences, value)
+
+
+# Per-key calldata tails, ABI-encoded once at import. In
+# text(bytes32,string) only the namehash (the first head slot) varies per
+# name; the offset word and encoded key string after it are constant, so a
+# call is selector + namehash + tail with no per-call ABI encoding.
+_TEXT_CALL_TAILS: list[tuple[str, bytes]] = [
+    (key, abi_encode(["bytes32", "string"], [b"\x00" * 32, key])[32:])
+    for key in ENSClient.TEXT_RECORDS
+]
 
 
 # Singleton instance for convenience
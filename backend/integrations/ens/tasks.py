@@ -4,14 +4,72 @@ Celery tasks for ENS integration.
 
 import asyncio
 import logging
+from collections import defaultdict
 
 from celery import shared_task
+from celery.signals import worker_process_init
+from django.core.cache import cache
 from django.utils import timezone
 
 from parameters.common.logger.logger_service import LoggerService
 
 logger = logging.getLogger(__name__)
 
+# One long-lived loop per worker process; asyncio.run would build and tear
+# down a loop (and everything pooled on it) for every task invocation
+_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+@worker_process_init.connect
+def _init_event_loop(**kwargs):
+    """Create the per-worker event loop when the worker process forks."""
+    global _LOOP
+    _LOOP = asyncio.new_event_loop()
+    asyncio.set_event_loop(_LOOP)
+
+
+def _run(coro):
+    """Run a coroutine on the persistent worker loop."""
+    if _LOOP is None or _LOOP.is_closed():
+        # Eager mode or direct invocation outside a Celery worker
+        return asyncio.run(coro)
+    return _LOOP.run_until_complete(coro)
+
+
+# Wallet fields written by an ENS preferences refresh (bulk_update list)
+ENS_WALLET_FIELDS = [
+    "ens_name",
+    "ens_min_apy",
+    "ens_max_risk",
+    "ens_chains",
+    "ens_protocols",
+    "ens_auto_rebalance",
+    "ens_updated_at",
+]
+
+# Flush pending wallet updates to the DB in batches of this size
+BULK_UPDATE_BATCH = 500
+
+# Max in-flight ENS lookups; wall time becomes max(latency) per batch
+# instead of the sum, without hammering the RPC endpoint
+ENS_FETCH_CONCURRENCY = 32
+
+# Reverse-resolve results cached in Redis: negatives are mostly permanent
+# (a day saves one mainnet round-trip per ENS-less wallet per cycle);
+# positives get a short TTL so newly-set primaries surface within a cycle
+REVERSE_NEG_TTL = 86400
+REVERSE_POS_TTL = 1800
+
+
+def _apply_preferences(wallet, preferences: dict) -> None:
+    """Copy fetched ENS preferences onto the wallet instance (in memory)."""
+    wallet.ens_min_apy = preferences.get("min_apy")
+    wallet.ens_max_risk = preferences.get("max_risk")
+    wallet.ens_chains = preferences.get("chains", [])
+    wallet.ens_protocols = preferences.get("protocols", [])
+    wallet.ens_auto_rebalance = preferences.get("auto_rebalance", False)
+    wallet.ens_updated_at = timezone.now()
+
 
 @shared_task(name="integrations.ens.tasks.warm_ens_cache")
 def warm_ens_cache() -> dict:
@@ -25,7 +83,7 @@ def warm_ens_cache() -> dict:
     """
     logger.info("warm_ens_cache: Starting ENS preferences sync")
     try:
-        result = asyncio.run(_warm_ens_cache_async())
+        result = _run(_warm_ens_cache_async())
     except Exception as e:
         logger.error(
             "warm_ens_cache: Task failed",
@@ -61,83 +119,147 @@ async def _warm_ens_cache_async() -> dict:
     updated = 0
     resolved = 0
     errors = []
+    pending = []
+
+    async def _flush() -> None:
+        """One bulk UPDATE for the accumulated wallets instead of N saves."""
+        if not pending:
+            return
+        batch = pending[:]
+        pending.clear()
+        await Wallet.objects.abulk_update(
+            batch, ENS_WALLET_FIELDS, batch_size=BULK_UPDATE_BATCH
+        )
 
-    # Get all wallets with ENS names
-    wallets = await asyncio.to_thread(
-        lambda: list(Wallet.objects.exclude(ens_name__isnull=True).exclude(ens_name=""))
+    # Get all wallets with ENS names as plain rows: values_list avoids
+    # instantiating a full model per wallet just to read three columns
+    rows = [
+        row
+        async for row in Wallet.objects.exclude(ens_name__isnull=True)
+        .exclude(ens_name="")
+        .values_list("id", "address", "ens_name", named=True)
+        .aiterator(chunk_size=BULK_UPDATE_BATCH)
+    ]
+    logger.info(f"warm_ens_cache: Found {len(rows)} wallets with ENS names")
+
+    sem = asyncio.Semaphore(ENS_FETCH_CONCURRENCY)
+
+    # Wallets can share an ENS name (a multisig and its signer, say);
+    # fetch each distinct name once and fan the result out to the group
+    by_name: dict[str, list] = defaultdict(list)
+    for row in rows:
+        by_name[row.ens_name].append(row)
+
+    async def _fetch_name(name: str) -> dict:
+        """Fetch preferences for one ENS name (bounded by the semaphore)."""
+        async with sem:
+            return await client.get_preferences(name)
+
+    # Overlap the per-name RPC round-trips instead of serializing them
+    names = list(by_name)
+    outcomes = await asyncio.gather(
+        *[_fetch_name(n) for n in names], return_exceptions=True
     )
-    logger.info(f"warm_ens_cache: Found {len(wallets)} wallets with ENS names")
-
-    for wallet in wallets:
-        try:
-            preferences = await client.get_preferences(wallet.ens_name)
-
-            # Update wallet with fetched preferences
-            wallet.ens_min_apy = preferences.get("min_apy")
-            wallet.ens_max_risk = preferences.get("max_risk")
-            wallet.ens_chains = preferences.get("chains", [])
-            wallet.ens_protocols = preferences.get("protocols", [])
-            wallet.ens_auto_rebalance = preferences.get("auto_rebalance", False)
-            wallet.ens_updated_at = timezone.now()
-            await asyncio.to_thread(wallet.save)
-
-            updated += 1
-            logger.debug(f"warm_ens_cache: Updated preferences for {wallet.ens_name}")
-
-        except Exception as e:
-            errors.append(
-                {
-                    "wallet": wallet.address,
-                    "ens_name": wallet.ens_name,
-                    "step": "preferences",
-                    "error": str(e),
-                }
-            )
+    for name, outcome in zip(names, outcomes):
+        group = by_name[name]
+        if isinstance(outcome, Exception):
+            for row in group:
+                errors.append(
+                    {
+                        "wallet": row.address,
+                        "ens_name": name,
+                        "step": "preferences",
+                        "error": str(outcome),
+                    }
+                )
             logger.error(
-                f"warm_ens_cache: Failed to update preferences for {wallet.ens_name}",
-                exc_info=True,
-                extra={"wallet": wallet.address, "ens_name": wallet.ens_name},
+                f"warm_ens_cache: Failed to update preferences for {name}",
+                extra={"ens_name": name, "wallet_count": len(group)},
             )
+            continue
+
+        for row in group:
+            # Unsaved shell carrying only pk + updated fields; bulk_update
+            # writes exactly the fields we set
+            wallet = Wallet(pk=row.id, address=row.address, ens_name=name)
+            _apply_preferences(wallet, outcome)
+            pending.append(wallet)
+            updated += 1
+        if len(pending) >= BULK_UPDATE_BATCH:
+            await _flush()
 
-    # Also try to resolve ENS names for wallets without them
-    wallets_without_ens = await asyncio.to_thread(
-        lambda: list(Wallet.objects.filter(ens_name__isnull=True))
-    )
+        logger.debug(f"warm_ens_cache: Updated preferences for {name}")
 
-    for wallet in wallets_without_ens:
-        try:
-            ens_name = await client.reverse_resolve(wallet.address)
-            if ens_name:
-                wallet.ens_name = ens_name
-                await asyncio.to_thread(lambda: wallet.save(update_fields=["ens_name"]))
-                resolved += 1
-                logger.info(
-                    f"warm_ens_cache: Resolved ENS name {ens_name} for {wallet.address}"
-                )
+    # Also try to resolve ENS names for wallets without them
+    rows_without_ens = [
+        row
+        async for row in Wallet.objects.filter(ens_name__isnull=True)
+        .values_list("id", "address", named=True)
+        .aiterator(chunk_size=BULK_UPDATE_BATCH)
+    ]
+
+    async def _resolve_one(row):
+        """
+        Reverse-resolve one wallet and fetch preferences for the name.
+
+        Both round-trips run back-to-back under one semaphore slot, so a
+        wallet is a single pipeline stage rather than two queued hops.
+        """
+        neg_key = f"ens:rev:neg:{row.address}"
+        if await cache.aget(neg_key):
+            return None
+
+        async with sem:
+            ens_name = await cache.aget(f"ens:rev:{row.address}")
+            if ens_name is None:
+                ens_name = await client.reverse_resolve(row.address)
+            if not ens_name:
+                await cache.aset(neg_key, 1, REVERSE_NEG_TTL)
+                return None
+            await cache.aset(f"ens:rev:{row.address}", ens_name, REVERSE_POS_TTL)
+
+            wallet = Wallet(pk=row.id, address=row.address, ens_name=ens_name)
+            logger.info(
+                f"warm_ens_cache: Resolved ENS name {ens_name} for {row.address}"
+            )
 
-                # Now fetch preferences for the newly resolved name
+            # Now fetch preferences for the newly resolved name
+            try:
                 preferences = await client.get_preferences(ens_name)
-                wallet.ens_min_apy = preferences.get("min_apy")
-                wallet.ens_max_risk = preferences.get("max_risk")
-                wallet.ens_chains = preferences.get("chains", [])
-                wallet.ens_protocols = preferences.get("protocols", [])
-                wallet.ens_auto_rebalance = preferences.get("auto_rebalance", False)
-                wallet.ens_updated_at = timezone.now()
-                await asyncio.to_thread(wallet.save)
-
-                updated += 1
-
-        except Exception as e:
+            except Exception:
+                # Keep the resolved name even if preferences failed
+                await wallet.asave(update_fields=["ens_name"])
+                raise
+        _apply_preferences(wallet, preferences)
+        return wallet
+
+    outcomes = await asyncio.gather(
+        *[_resolve_one(r) for r in rows_without_ens], return_exceptions=True
+    )
+    for row, outcome in zip(rows_without_ens, outcomes):
+        if isinstance(outcome, Exception):
             errors.append(
                 {
-                    "wallet": wallet.address,
+                    "wallet": row.address,
                     "step": "reverse_resolve",
-                    "error": str(e),
+                    "error": str(outcome),
                 }
             )
             logger.debug(
-                f"warm_ens_cache: Failed to reverse resolve {wallet.address}: {e}"
+                f"warm_ens_cache: Failed to reverse resolve {row.address}: {outcome}"
             )
+            continue
+        if outcome is None:
+            continue
+
+        pending.append(outcome)
+        if len(pending) >= BULK_UPDATE_BATCH:
+            await _flush()
+
+        resolved += 1
+        updated += 1
+
+    await _flush()
 
     result = {
         "updated": updated,
@@ -170,7 +292,7 @@ def update_wallet_ens(wallet_address: str) -> dict:
         Dict with task results
     """
     logger.info(f"update_wallet_ens: Starting ENS update for {wallet_address[:10]}...")
-    return asyncio.run(_update_wallet_ens_async(wallet_address))
+    return _run(_update_wallet_ens_async(wallet_address))
 
 
 async def _update_wallet_ens_async(wallet_address: str) -> dict:
@@ -182,10 +304,7 @@ async def _update_wallet_ens_async(wallet_address: str) -> dict:
     wallet_address = wallet_address.lower()
 
     try:
-        wallet = await asyncio.to_thread(
-            Wallet.objects.get,
-            address=wallet_address,
-        )
+        wallet = await Wallet.objects.aget(address=wallet_address)
     except Wallet.DoesNotExist:
         logger.warning(
             f"update_wallet_ens: Wallet not found: {wallet_address}",
@@ -221,7 +340,7 @@ async def _update_wallet_ens_async(wallet_address: str) -> dict:
             wallet.ens_auto_rebalance = preferences.get("auto_rebalance", False)
             wallet.ens_updated_at = timezone.now()
 
-            await asyncio.to_thread(wallet.save)
+            await wallet.asave()
 
             logger.info(
                 f"update_wallet_ens: Updated preferences for {wallet.ens_name}",
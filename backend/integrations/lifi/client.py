@@ -5,13 +5,25 @@ API: https://li.quest/v1
 Docs: https://docs.li.fi/
 """
 
+import asyncio
+import copy
 import logging
+import time
 from typing import Any
 
+import httpx
 from django.conf import settings
 
+from urllib.parse import urlencode
+
 from integrations.base import BaseAsyncClient, APIError
-from .types import QuoteRequest, QuoteResponse, StatusResponse
+from .types import (
+    QUOTE_RESPONSE_ADAPTER,
+    STATUS_RESPONSE_ADAPTER,
+    QuoteRequest,
+    QuoteResponse,
+    StatusResponse,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,19 +39,87 @@ class LiFiClient(BaseAsyncClient):
     BASE_URL = "https://li.quest/v1"
     DEFAULT_TIMEOUT = 60.0  # Bridge quotes can be slow
 
-    def __init__(self, api_key: str | None = None):
+    # Metadata endpoints change on the order of hours; short in-process
+    # TTLs drop most of these calls from the quote pipeline. Quotes and
+    # status stay uncached - they are request-specific.
+    CHAINS_CACHE_TTL = 3600.0
+    TOKENS_CACHE_TTL = 3600.0
+    CONNECTIONS_CACHE_TTL = 300.0
+
+    def __init__(self, api_key: str | None = None, pool_size: int = 100):
         """
         Initialize LI.FI client.
 
         Args:
             api_key: LI.FI API key (optional but recommended for higher rate limits)
+            pool_size: Max concurrent connections in the HTTP pool. Sized
+                for many vaults polling status in parallel, replacing the
+                much smaller per-host default.
         """
         api_key = api_key or settings.LIFI_API_KEY
         headers = {}
         if api_key:
             headers["x-lifi-api-key"] = api_key
 
-        super().__init__(headers=headers)
+        super().__init__(
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=50,
+                keepalive_expiry=30,
+            ),
+        )
+
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._cache_lock = asyncio.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        # Cap in-flight requests so a burst of quote/status calls stays
+        # under LI.FI's rate limits instead of tripping 429s
+        self._sem = asyncio.Semaphore(
+            int(getattr(settings, "LIFI_MAX_CONCURRENCY", 15))
+        )
+
+    async def _limited_get(self, path: str, params: dict | None = None) -> Any:
+        """GET with the global concurrency cap applied."""
+        async with self._sem:
+            return await self._get(path, params=params)
+
+    async def _cached(self, key: tuple, ttl: float, coro_factory):
+        """
+        TTL-cache a metadata read (single-flight under one lock).
+
+        Returns a deep copy so callers can mutate results without
+        poisoning the cache.
+        """
+        entry = self._cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            self._cache_hits += 1
+            return copy.deepcopy(entry[1])
+
+        async with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry[0] < ttl:
+                self._cache_hits += 1
+                return copy.deepcopy(entry[1])
+
+            self._cache_misses += 1
+            value = await coro_factory()
+            self._cache[key] = (time.monotonic(), value)
+            return copy.deepcopy(value)
+
+    def clear_cache(self) -> None:
+        """Drop all cached metadata responses."""
+        self._cache.clear()
+
+    def cache_stats(self) -> dict[str, int]:
+        """Hit/miss counters plus current entry count."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "entries": len(self._cache),
+        }
 
     async def get_quote(
         self,
@@ -87,8 +167,26 @@ class LiFiClient(BaseAsyncClient):
         }
 
         try:
-            response = await self._get("/quote", params=params)
-            return QuoteResponse.model_validate(response)
+            response = await self._limited_get("/quote", params=params)
+            return QUOTE_RESPONSE_ADAPTER.validate_python(response)
+        except Exception as e:
+            logger.error(f"Failed to get LI.FI quote: {e}")
+            raise APIError(f"Failed to get quote: {e}")
+
+    async def get_quote_raw(self, **params: Any) -> dict[str, Any]:
+        """
+        Get a quote as the parsed JSON dict, skipping model validation.
+
+        For callers that only read a few fields (reporting, route
+        comparison) the full QuoteResponse tree - every nested TokenInfo,
+        fee and gas cost - is wasted construction. Takes the same
+        camelCase query parameters the /quote endpoint accepts.
+
+        Returns:
+            Parsed quote response as a dict
+        """
+        try:
+            return await self._limited_get("/quote", params=params)
         except Exception as e:
             logger.error(f"Failed to get LI.FI quote: {e}")
             raise APIError(f"Failed to get quote: {e}")
@@ -116,6 +214,34 @@ class LiFiClient(BaseAsyncClient):
             preferBridges=request.preferBridges,
         )
 
+    async def get_quotes_batch(
+        self,
+        requests: list[QuoteRequest],
+        per_timeout: float = 20.0,
+    ) -> list[QuoteResponse | Exception]:
+        """
+        Fetch several quotes concurrently.
+
+        Each quote gets its own timeout so one slow route cannot hold up
+        the whole batch. Results come back in request order; failed or
+        timed-out entries are returned as exceptions instead of raising,
+        so callers can rank whichever quotes succeeded.
+
+        Args:
+            requests: QuoteRequest objects to fetch
+            per_timeout: Per-quote timeout in seconds
+
+        Returns:
+            List of QuoteResponse or Exception, aligned with ``requests``
+        """
+        return await asyncio.gather(
+            *(
+                asyncio.wait_for(self.get_quote_request(request), per_timeout)
+                for request in requests
+            ),
+            return_exceptions=True,
+        )
+
     async def get_status(
         self,
         tx_hash: str,
@@ -135,6 +261,24 @@ class LiFiClient(BaseAsyncClient):
         Returns:
             StatusResponse with transaction status
         """
+        return await self.get_status_prepared(
+            self.build_status_path(tx_hash, from_chain, to_chain, bridge)
+        )
+
+    def build_status_path(
+        self,
+        tx_hash: str,
+        from_chain: int | None = None,
+        to_chain: int | None = None,
+        bridge: str | None = None,
+    ) -> str:
+        """
+        Prebuild the /status path with its query string encoded once.
+
+        Status checks for one transaction repeat with identical
+        parameters; building the path up front keeps dict construction
+        and query encoding out of the poll loop.
+        """
         params: dict[str, Any] = {"txHash": tx_hash}
         if from_chain:
             params["fromChain"] = from_chain
@@ -142,18 +286,25 @@ class LiFiClient(BaseAsyncClient):
             params["toChain"] = to_chain
         if bridge:
             params["bridge"] = bridge
+        return "/status?" + urlencode(params)
 
+    async def get_status_prepared(self, path: str) -> StatusResponse:
+        """Check status using a path from build_status_path()."""
         try:
-            response = await self._get("/status", params=params)
-            return StatusResponse.model_validate(response)
+            response = await self._limited_get(path)
+            return STATUS_RESPONSE_ADAPTER.validate_python(response)
         except Exception as e:
             logger.error(f"Failed to get LI.FI status: {e}")
             raise APIError(f"Failed to get status: {e}")
 
     async def get_chains(self) -> list[dict[str, Any]]:
-        """Get list of supported chains."""
-        response = await self._get("/chains")
-        return response.get("chains", [])
+        """Get list of supported chains (cached for an hour)."""
+
+        async def _fetch():
+            response = await self._limited_get("/chains")
+            return response.get("chains", [])
+
+        return await self._cached(("chains",), self.CHAINS_CACHE_TTL, _fetch)
 
     async def get_tokens(
         self, chains: list[int] | None = None
@@ -171,8 +322,12 @@ class LiFiClient(BaseAsyncClient):
         if chains:
             params["chains"] = ",".join(str(c) for c in chains)
 
-        response = await self._get("/tokens", params=params)
-        return response.get("tokens", {})
+        async def _fetch():
+            response = await self._limited_get("/tokens", params=params)
+            return response.get("tokens", {})
+
+        key = ("tokens", tuple(sorted(chains)) if chains else None)
+        return await self._cached(key, self.TOKENS_CACHE_TTL, _fetch)
 
     async def get_connections(
         self,
@@ -198,8 +353,12 @@ class LiFiClient(BaseAsyncClient):
         if to_chain:
             params["toChain"] = to_chain
 
-        response = await self._get("/connections", params=params)
-        return response.get("connections", [])
+        async def _fetch():
+            response = await self._limited_get("/connections", params=params)
+            return response.get("connections", [])
+
+        key = ("connections", from_chain, from_token.lower(), to_chain)
+        return await self._cached(key, self.CONNECTIONS_CACHE_TTL, _fetch)
 
 
 # Singleton instance
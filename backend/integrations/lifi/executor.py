@@ -11,17 +11,65 @@ Handles the complete flow:
 
 import asyncio
 import logging
+import threading
+from functools import lru_cache
 from typing import Any
 
-from web3 import AsyncWeb3
+from eth_abi import encode as abi_encode
+from eth_utils import function_signature_to_4byte_selector
+from web3 import AsyncWeb3, Web3
 from web3.providers import AsyncHTTPProvider
 
 from config.chains import SUPPORTED_CHAINS
-from .client import LiFiClient
+from .client import get_lifi_client
+from .poller import get_status_poller
 from .types import QuoteResponse, StatusResponse
 
 logger = logging.getLogger(__name__)
 
+# Checksumming keccaks the address every call; the executor touches the
+# same handful of token/spender/router addresses constantly, so memoize
+_checksum = lru_cache(maxsize=4096)(Web3.to_checksum_address)
+
+# 4-byte selectors precomputed once at import; the allowance read builds
+# its calldata directly instead of walking web3's contract machinery
+ALLOWANCE_SELECTOR = function_signature_to_4byte_selector("allowance(address,address)")
+APPROVE_SELECTOR = function_signature_to_4byte_selector("approve(address,uint256)")
+
+
+def _allowance_calldata(owner: str, spender: str) -> bytes:
+    """ABI-encoded calldata for allowance(owner, spender)."""
+    return ALLOWANCE_SELECTOR + abi_encode(["address", "address"], [owner, spender])
+
+# Web3 clients shared across executor instances. Executors are typically
+# constructed per request; a module-level cache means each chain's RPC
+# connection pool is built once per process, not once per executor.
+_web3_clients: dict[int, AsyncWeb3] = {}
+_web3_lock = threading.Lock()
+
+
+def _get_web3(chain_id: int) -> AsyncWeb3:
+    """Get the process-wide AsyncWeb3 instance for a chain."""
+    client = _web3_clients.get(chain_id)
+    if client is None:
+        chain_config = SUPPORTED_CHAINS.get(chain_id)
+        if not chain_config:
+            raise LiFiExecutionError(
+                f"Unsupported chain: {chain_id}",
+                step="init",
+            )
+        with _web3_lock:
+            client = _web3_clients.get(chain_id)
+            if client is None:
+                client = AsyncWeb3(
+                    AsyncHTTPProvider(
+                        chain_config["rpc"],
+                        request_kwargs={"timeout": 30},
+                    )
+                )
+                _web3_clients[chain_id] = client
+    return client
+
 
 # ERC20 ABI for approval
 ERC20_ABI = [
@@ -70,8 +118,6 @@ class LiFiExecutor:
 
     # Maximum time to wait for cross-chain tx (30 minutes)
     MAX_WAIT_TIME = 1800
-    # Poll interval for status checks
-    POLL_INTERVAL = 10
 
     def __init__(self, private_key: str | None = None):
         """
@@ -82,8 +128,10 @@ class LiFiExecutor:
                         reads from AGENT_WALLET_PRIVATE_KEY env var.
         """
         self.private_key = private_key
-        self.lifi_client = LiFiClient()
-        self._web3_clients: dict[int, AsyncWeb3] = {}
+        # Process-wide singleton: its pooled HTTP connection stays warm
+        # across quotes and every status poll
+        self.lifi_client = get_lifi_client()
+        self._erc20_contracts: dict[tuple[int, str], Any] = {}
 
     def _get_private_key(self) -> str:
         """Get private key, raising error if not configured."""
@@ -100,19 +148,22 @@ class LiFiExecutor:
             )
         return pk
 
-    def _get_web3(self, chain_id: int) -> AsyncWeb3:
-        """Get AsyncWeb3 instance for a chain."""
-        if chain_id not in self._web3_clients:
-            chain_config = SUPPORTED_CHAINS.get(chain_id)
-            if not chain_config:
-                raise LiFiExecutionError(
-                    f"Unsupported chain: {chain_id}",
-                    step="init",
-                )
-            self._web3_clients[chain_id] = AsyncWeb3(
-                AsyncHTTPProvider(chain_config["rpc"])
+    def _erc20(self, chain_id: int, token_address: str):
+        """
+        Get a cached ERC20 contract for a token.
+
+        Building a contract reparses the ABI each time; batch flows hit
+        the same USDC contract over and over, so keep one per token.
+        """
+        address = _checksum(token_address)
+        key = (chain_id, address)
+        contract = self._erc20_contracts.get(key)
+        if contract is None:
+            contract = _get_web3(chain_id).eth.contract(
+                address=address, abi=ERC20_ABI
             )
-        return self._web3_clients[chain_id]
+            self._erc20_contracts[key] = contract
+        return contract
 
     async def get_quote(
         self,
@@ -139,16 +190,15 @@ class LiFiExecutor:
         Returns:
             QuoteResponse with transaction data
         """
-        async with self.lifi_client:
-            quote = await self.lifi_client.get_quote(
-                from_chain=from_chain,
-                from_token=from_token,
-                from_amount=from_amount,
-                to_chain=to_chain,
-                to_token=to_token,
-                from_address=from_address,
-                slippage=slippage,
-            )
+        quote = await self.lifi_client.get_quote(
+            from_chain=from_chain,
+            from_token=from_token,
+            from_amount=from_amount,
+            to_chain=to_chain,
+            to_token=to_token,
+            from_address=from_address,
+            slippage=slippage,
+        )
 
         logger.info(
             f"Got LI.FI quote: {quote.action.fromToken.symbol} -> "
@@ -180,17 +230,23 @@ class LiFiExecutor:
         Returns:
             Approval tx hash if approval was sent, None if already approved
         """
-        web3 = self._get_web3(chain_id)
-        token = web3.eth.contract(
-            address=web3.to_checksum_address(token_address),
-            abi=ERC20_ABI,
+        web3 = _get_web3(chain_id)
+        token_addr = _checksum(token_address)
+        owner = _checksum(from_address)
+        spender = _checksum(spender_address)
+
+        # Independent reads in one concurrent round trip; the nonce and
+        # gas price are only used when an approval actually goes out, but
+        # fetching them alongside the allowance costs nothing extra. The
+        # allowance is a raw eth_call against precomputed calldata.
+        raw_allowance, nonce, gas_price = await asyncio.gather(
+            web3.eth.call(
+                {"to": token_addr, "data": _allowance_calldata(owner, spender)}
+            ),
+            web3.eth.get_transaction_count(owner),
+            web3.eth.gas_price,
         )
-
-        # Check current allowance
-        allowance = await token.functions.allowance(
-            web3.to_checksum_address(from_address),
-            web3.to_checksum_address(spender_address),
-        ).call()
+        allowance = int.from_bytes(raw_allowance, "big")
 
         amount_int = int(amount)
         if allowance >= amount_int:
@@ -200,19 +256,31 @@ class LiFiExecutor:
         # Need to approve
         logger.info(f"Approving token: {token_address} for {spender_address}")
 
+        return await self._send_approval(
+            web3, self._erc20(chain_id, token_address), spender, nonce, gas_price
+        )
+
+    async def _send_approval(
+        self,
+        web3: AsyncWeb3,
+        token,
+        spender: str,
+        nonce: int,
+        gas_price: int,
+    ) -> str:
+        """Build, sign and send a max approval, waiting for its receipt."""
         private_key = self._get_private_key()
         account = web3.eth.account.from_key(private_key)
 
-        # Build approval tx
         approve_tx = await token.functions.approve(
-            web3.to_checksum_address(spender_address),
+            spender,
             2**256 - 1,  # Max approval
         ).build_transaction(
             {
                 "from": account.address,
-                "nonce": await web3.eth.get_transaction_count(account.address),
+                "nonce": nonce,
                 "gas": 100000,
-                "gasPrice": await web3.eth.gas_price,
+                "gasPrice": gas_price,
             }
         )
 
@@ -254,7 +322,7 @@ class LiFiExecutor:
 
         tx_request = quote.transactionRequest
         chain_id = tx_request.chainId or quote.action.fromChainId
-        web3 = self._get_web3(chain_id)
+        web3 = _get_web3(chain_id)
 
         private_key = self._get_private_key()
         account = web3.eth.account.from_key(private_key)
@@ -269,25 +337,30 @@ class LiFiExecutor:
                 from_address=account.address,
             )
 
+        # Nonce must be read after any approval above (which consumes one);
+        # it and the gas price are independent, so fetch them concurrently
+        nonce, gas_price = await asyncio.gather(
+            web3.eth.get_transaction_count(account.address),
+            web3.eth.gas_price,
+        )
+
         # Build transaction
         tx = {
-            "to": web3.to_checksum_address(tx_request.to),
+            "to": _checksum(tx_request.to),
             "data": tx_request.data,
-            "value": int(tx_request.value, 16)
-            if tx_request.value.startswith("0x")
-            else int(tx_request.value),
+            "value": tx_request.value_int,
             "from": account.address,
-            "nonce": await web3.eth.get_transaction_count(account.address),
+            "nonce": nonce,
             "chainId": chain_id,
         }
 
         # Gas estimation
-        if tx_request.gasLimit:
-            tx["gas"] = int(tx_request.gasLimit)
+        if tx_request.gas_limit_int is not None:
+            tx["gas"] = tx_request.gas_limit_int
         else:
             tx["gas"] = await web3.eth.estimate_gas(tx)
 
-        tx["gasPrice"] = await web3.eth.gas_price
+        tx["gasPrice"] = gas_price
 
         # Sign and send
         signed = account.sign_transaction(tx)
@@ -304,7 +377,10 @@ class LiFiExecutor:
         to_chain: int | None = None,
     ) -> StatusResponse:
         """
-        Step 4: Poll status until transaction completes.
+        Step 4: Wait for the transaction to reach a terminal status.
+
+        Delegates to the shared status poller, which batches status
+        lookups for every in-flight transaction into one poll loop.
 
         Args:
             tx_hash: Transaction hash from execute()
@@ -314,37 +390,26 @@ class LiFiExecutor:
         Returns:
             Final status response
         """
-        start_time = asyncio.get_event_loop().time()
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > self.MAX_WAIT_TIME:
-                raise LiFiExecutionError(
-                    f"Transaction timeout after {self.MAX_WAIT_TIME}s",
-                    step="status",
-                    details={"tx_hash": tx_hash},
-                )
-
-            async with self.lifi_client:
-                status = await self.lifi_client.get_status(
-                    tx_hash=tx_hash,
-                    from_chain=from_chain,
-                    to_chain=to_chain,
-                )
-
-            logger.info(f"Transaction status: {status.status} ({status.substatus})")
-
-            if status.is_complete:
-                return status
+        try:
+            status = await get_status_poller().watch(tx_hash, from_chain, to_chain)
+        except asyncio.CancelledError:
+            logger.info(f"Cancelled while waiting for {tx_hash}; polling stopped")
+            raise
+        except asyncio.TimeoutError:
+            raise LiFiExecutionError(
+                f"Transaction timeout after {self.MAX_WAIT_TIME}s",
+                step="status",
+                details={"tx_hash": tx_hash},
+            )
 
-            if status.is_failed:
-                raise LiFiExecutionError(
-                    f"Transaction failed: {status.substatusMessage}",
-                    step="status",
-                    details={"tx_hash": tx_hash, "status": status.model_dump()},
-                )
+        if status.is_failed:
+            raise LiFiExecutionError(
+                f"Transaction failed: {status.substatusMessage}",
+                step="status",
+                details={"tx_hash": tx_hash, "status": status.model_dump()},
+            )
 
-            await asyncio.sleep(self.POLL_INTERVAL)
+        return status
 
     async def execute_full_flow(
         self,
@@ -0,0 +1,176 @@
+"""
+Shared status poller for in-flight LI.FI transactions.
+
+Each pending transaction used to run its own poll loop against /status,
+so N vaults bridging at once produced N independent request streams to
+the same endpoint. The poller keeps a single loop: on every tick it
+checks all watched transactions in one concurrent burst over the pooled
+HTTP/2 connection, so polling load scales with poll cycles rather than
+transactions times polls.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from django.core.cache import cache
+
+from .client import get_lifi_client
+from .types import StatusResponse
+
+logger = logging.getLogger(__name__)
+
+
+class StatusPollerService:
+    """
+    Coalesces status polling for LI.FI transactions.
+
+    Callers register a transaction with ``watch()`` and await its terminal
+    status. The poll tick uses the same widening backoff the executor used
+    per-transaction, reset to the quick initial interval whenever a new
+    transaction joins so fresh same-chain swaps still return fast.
+    """
+
+    # Maximum time to wait for cross-chain tx (30 minutes)
+    MAX_WAIT_TIME = 1800
+    # Quick first checks, then widening intervals up to MAX_POLL
+    INITIAL_POLL = 2.0
+    BACKOFF_FACTOR = 1.5
+    MAX_POLL = 30.0
+
+    def __init__(self):
+        self.lifi_client = get_lifi_client()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._delay = self.INITIAL_POLL
+        self._loop_task: asyncio.Task | None = None
+
+    async def watch(
+        self,
+        tx_hash: str,
+        from_chain: int,
+        to_chain: int | None = None,
+    ) -> StatusResponse:
+        """
+        Register a transaction and wait for its terminal status.
+
+        Returns the final StatusResponse (complete or failed); raises
+        asyncio.TimeoutError after MAX_WAIT_TIME and propagates status
+        lookup errors. Interpreting failure is left to the caller.
+        """
+        start_delay = await self._resumed_delay(tx_hash)
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[tx_hash] = {
+            # Query string encoded once; every tick reuses it
+            "path": self.lifi_client.build_status_path(tx_hash, from_chain, to_chain),
+            "future": future,
+            "deadline": time.monotonic() + self.MAX_WAIT_TIME,
+        }
+
+        # A newcomer may want a faster check than the current shared tick
+        self._delay = min(self._delay, start_delay)
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._poll_loop())
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Caller gave up: unregister now instead of polling this tx
+            # for up to MAX_WAIT_TIME more
+            self._pending.pop(tx_hash, None)
+            raise
+
+    async def _resumed_delay(self, tx_hash: str) -> float:
+        """
+        Backoff stage to start this transaction from.
+
+        Remembers when a tx was first seen so a worker restart resumes at
+        the matching stage instead of tight polling from scratch.
+        """
+        first_seen_key = f"lifi:poll:first_seen:{tx_hash}"
+        now = time.time()
+        first_seen = await cache.aget(first_seen_key)
+        if first_seen is None:
+            first_seen = now
+            await cache.aset(first_seen_key, now, self.MAX_WAIT_TIME * 2)
+
+        delay = self.INITIAL_POLL
+        age = now - first_seen
+        while age > delay and delay < self.MAX_POLL:
+            age -= delay
+            delay = min(delay * self.BACKOFF_FACTOR, self.MAX_POLL)
+        return delay
+
+    async def _poll_loop(self):
+        while self._pending:
+            # return_exceptions so one broken check can never take down
+            # the shared loop and strand the other watchers
+            results = await asyncio.gather(
+                *(self._check_one(tx_hash) for tx_hash in list(self._pending)),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.exception("Status check failed", exc_info=result)
+            if not self._pending:
+                break
+            await asyncio.sleep(self._delay)
+            self._delay = min(self._delay * self.BACKOFF_FACTOR, self.MAX_POLL)
+        self._delay = self.INITIAL_POLL
+
+    async def _check_one(self, tx_hash: str) -> None:
+        entry = self._pending.get(tx_hash)
+        if entry is None:
+            return
+
+        future = entry["future"]
+        if future.done():
+            # Caller went away (cancelled); stop polling for it
+            self._pending.pop(tx_hash, None)
+            return
+
+        try:
+            status = await self.lifi_client.get_status_prepared(entry["path"])
+        except Exception as e:
+            self._pending.pop(tx_hash, None)
+            # The watcher may have been cancelled during the await;
+            # resolving a done future raises InvalidStateError
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        logger.info(f"Transaction status: {status.status} ({status.substatus})")
+
+        if status.is_complete or status.is_failed:
+            self._pending.pop(tx_hash, None)
+            if not future.done():
+                future.set_result(status)
+            return
+
+        if time.monotonic() > entry["deadline"]:
+            self._pending.pop(tx_hash, None)
+            if not future.done():
+                future.set_exception(
+                    asyncio.TimeoutError(
+                        f"No terminal status after {self.MAX_WAIT_TIME}s"
+                    )
+                )
+
+
+# One poller per event loop: the pending map, the poll-loop task and the
+# watcher futures are all loop-affine, and sync entry points spin up a
+# fresh loop per asyncio.run() call
+_pollers: dict[int, tuple[asyncio.AbstractEventLoop, StatusPollerService]] = {}
+
+
+def get_status_poller() -> StatusPollerService:
+    """Get the status poller instance for the running event loop."""
+    loop = asyncio.get_running_loop()
+    for key, (poller_loop, _) in list(_pollers.items()):
+        if poller_loop.is_closed():
+            del _pollers[key]
+    entry = _pollers.get(id(loop))
+    if entry is None or entry[0] is not loop:
+        entry = (loop, StatusPollerService())
+        _pollers[id(loop)] = entry
+    return entry[1]
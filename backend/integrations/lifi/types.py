@@ -3,9 +3,10 @@ Pydantic models for LI.FI API types.
 """
 
 from decimal import Decimal
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class QuoteRequest(BaseModel):
@@ -35,6 +36,8 @@ class QuoteRequest(BaseModel):
 class TokenInfo(BaseModel):
     """Token information from LI.FI."""
 
+    model_config = ConfigDict(frozen=True)
+
     address: str
     symbol: str
     decimals: int
@@ -46,6 +49,8 @@ class TokenInfo(BaseModel):
 class FeeCost(BaseModel):
     """Fee cost information."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str | None = None
     percentage: str | None = None
@@ -58,6 +63,8 @@ class FeeCost(BaseModel):
 class GasCost(BaseModel):
     """Gas cost information."""
 
+    model_config = ConfigDict(frozen=True)
+
     type: str
     price: str | None = None
     estimate: str | None = None
@@ -70,6 +77,9 @@ class GasCost(BaseModel):
 class Estimate(BaseModel):
     """Quote estimate information."""
 
+    # Frozen so the cached_property accessors below can never go stale
+    model_config = ConfigDict(frozen=True)
+
     fromAmount: str
     toAmount: str
     toAmountMin: str
@@ -78,29 +88,36 @@ class Estimate(BaseModel):
     feeCosts: list[FeeCost] = []
     gasCosts: list[GasCost] = []
 
-    @property
+    @cached_property
     def from_amount_decimal(self) -> Decimal:
-        """Get from amount as Decimal."""
+        """Get from amount as Decimal (parsed once)."""
         return Decimal(self.fromAmount)
 
-    @property
+    @cached_property
     def to_amount_decimal(self) -> Decimal:
-        """Get to amount as Decimal."""
+        """Get to amount as Decimal (parsed once)."""
         return Decimal(self.toAmount)
 
-    @property
+    @cached_property
     def total_gas_usd(self) -> Decimal:
-        """Calculate total gas cost in USD."""
+        """Total gas cost in USD (summed once, then cached)."""
         total = Decimal("0")
         for gas in self.gasCosts:
             if gas.amountUSD:
                 total += Decimal(gas.amountUSD)
         return total
 
+    @classmethod
+    def total_gas_usd_batch(cls, estimates) -> list[Decimal]:
+        """Total gas in USD for many estimates in a single pass."""
+        return [estimate.total_gas_usd for estimate in estimates]
+
 
 class TransactionRequest(BaseModel):
     """Transaction data to execute."""
 
+    model_config = ConfigDict(frozen=True)
+
     to: str = Field(..., description="Contract address (LI.FI Diamond)")
     data: str = Field(..., description="Calldata for the transaction")
     value: str = Field(..., description="Native token value to send")
@@ -108,6 +125,22 @@ class TransactionRequest(BaseModel):
     gasPrice: str | None = Field(None, description="Recommended gas price")
     chainId: int | None = Field(None, description="Chain ID for the transaction")
 
+    @cached_property
+    def value_int(self) -> int:
+        """Native value as int; LI.FI sends either hex or decimal strings."""
+        return int(self.value, 16) if self.value.startswith("0x") else int(self.value)
+
+    @cached_property
+    def gas_limit_int(self) -> int | None:
+        """Gas limit as int, when the quote recommends one."""
+        if self.gasLimit is None:
+            return None
+        return (
+            int(self.gasLimit, 16)
+            if self.gasLimit.startswith("0x")
+            else int(self.gasLimit)
+        )
+
 
 class Action(BaseModel):
     """Action in the route."""
@@ -180,3 +213,10 @@ class StatusResponse(BaseModel):
     def is_pending(self) -> bool:
         """Check if transaction is still pending."""
         return self.status == "PENDING"
+
+
+# Prebuilt validators: resolving the core schema once at import is
+# measurably cheaper than model_validate's per-call class lookup on the
+# status-polling and quote hot paths.
+QUOTE_RESPONSE_ADAPTER = TypeAdapter(QuoteResponse)
+STATUS_RESPONSE_ADAPTER = TypeAdapter(StatusResponse)
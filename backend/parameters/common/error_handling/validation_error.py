@@ -1,9 +1,36 @@
 from rest_framework.exceptions import ErrorDetail
 
 
+def _push_list(stack, prefix, value):
+    # Reversed so items come off the stack in their original order
+    stack.extend((prefix, item) for item in reversed(value))
+
+
+def _push_dict(stack, prefix, value):
+    for field, field_value in reversed(value.items()):
+        if isinstance(field_value, dict):
+            # Containers extend the dotted path; leaves get "field: "
+            stack.append((f"{prefix}{field}.", field_value))
+        else:
+            stack.append((f"{prefix}{field}: ", field_value))
+
+
+# Exact-type dispatch table: one dict lookup per node replaces a chain of
+# isinstance checks on the hot path. Subclasses miss the table and fall
+# back to isinstance below.
+_CONTAINER_HANDLERS = {
+    list: _push_list,
+    tuple: _push_list,
+    dict: _push_dict,
+}
+
+
 def flatten_errors(errors):
     """
-    Recursively flatten validation errors into a list of messages.
+    Flatten validation errors into a list of messages.
+
+    Walks the structure iteratively with an explicit stack, so deeply
+    nested serializer errors never approach the recursion limit.
 
     Handles:
     - Simple ErrorDetail objects
@@ -13,55 +40,25 @@ def flatten_errors(errors):
     - Mixed structures
     """
     error_messages = []
-
-    if isinstance(errors, ErrorDetail):
-        # Single ErrorDetail object
-        error_messages.append(str(errors))
-
-    elif isinstance(errors, str):
-        # Plain string error
-        error_messages.append(errors)
-
-    elif isinstance(errors, (int, float, bool)):
-        # Primitive values (like attempt_id, challenge_id)
-        error_messages.append(str(errors))
-
-    elif isinstance(errors, list):
-        # List of errors
-        for error in errors:
-            error_messages.extend(flatten_errors(error))
-
-    elif isinstance(errors, dict):
-        # Dictionary of errors
-        for field, field_errors in errors.items():
-            if isinstance(field_errors, dict):
-                # Nested dictionary - recurse deeper
-                nested_errors = flatten_errors(field_errors)
-                for nested_error in nested_errors:
-                    error_messages.append(f"{field}.{nested_error}")
-
-            elif isinstance(field_errors, list):
-                # List of errors for this field
-                for error in field_errors:
-                    if isinstance(error, (str, ErrorDetail)):
-                        error_messages.append(f"{field}: {error}")
-                    else:
-                        # Recurse for complex objects in list
-                        error_messages.extend(flatten_errors(error))
-
-            elif isinstance(field_errors, (str, ErrorDetail, int, float, bool)):
-                # Single value (string, number, or ErrorDetail)
-                error_messages.append(f"{field}: {field_errors}")
-
-            else:
-                # Fallback for other types - recurse
-                nested_errors = flatten_errors(field_errors)
-                for nested_error in nested_errors:
-                    error_messages.append(f"{field}: {nested_error}")
-
-    else:
-        # Fallback for unknown types
-        error_messages.append(str(errors))
+    stack = [("", errors)]
+
+    while stack:
+        prefix, value = stack.pop()
+
+        handler = _CONTAINER_HANDLERS.get(type(value))
+        if handler is not None:
+            handler(stack, prefix, value)
+        elif isinstance(value, dict):
+            _push_dict(stack, prefix, value)
+        elif isinstance(value, (list, tuple)):
+            _push_list(stack, prefix, value)
+        else:
+            # Leaf: ErrorDetail, string, primitive or anything else.
+            # Plain concat instead of an f-string; for a top-level plain
+            # string the empty prefix makes this allocation-free.
+            if type(value) is not str:
+                value = str(value)
+            error_messages.append(prefix + value)
 
     return error_messages
 
@@ -79,14 +76,18 @@ def validation_error_handling(e):
     - Nested structures
     """
     errors = e.detail
-    error_messages = []
 
     if isinstance(errors, (str, ErrorDetail)):
-        # Simple string error
-        error_messages.append(str(errors))
+        # Simple string error: skip the list/join round trip
+        return str(errors)
 
     elif isinstance(errors, list):
+        # One plain message in a list is just as common as a bare string
+        if len(errors) == 1 and isinstance(errors[0], (str, ErrorDetail)):
+            return str(errors[0])
+
         # List of error dictionaries
+        error_messages = []
         for errors_dict in errors:
             if errors_dict:
                 error_messages.extend(flatten_errors(errors_dict))
@@ -103,7 +104,7 @@ def validation_error_handling(e):
 
     else:
         # Fallback
-        error_messages.append(str(errors))
+        return str(errors)
 
     # Join messages with proper formatting
     if not error_messages:
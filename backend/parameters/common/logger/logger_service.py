@@ -1,10 +1,114 @@
+import atexit
 import json
-from copy import deepcopy
+import logging
+import random
+import threading
 
+from django.conf import settings
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.serializers.json import DjangoJSONEncoder
 
-from parameters.serializers.log_serializer import LogSerializer
+from parameters.models import Log
+
+logger = logging.getLogger(__name__)
+
+# Log rows buffered for bulk insertion. A single INSERT per logged
+# request is the wrong tool at volume; batches of a few hundred rows cut
+# write time by orders of magnitude. Rows flush when the buffer fills or
+# a short timer fires, and atexit drains whatever is left on shutdown.
+_BUFFER: list[Log] = []
+_BUFFER_LOCK = threading.Lock()
+_FLUSH_THRESHOLD = 500
+_FLUSH_INTERVAL = 1.0
+_flush_timer: threading.Timer | None = None
+
+
+def _flush_buffer():
+    global _flush_timer
+    with _BUFFER_LOCK:
+        batch = _BUFFER[:]
+        _BUFFER.clear()
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    if batch:
+        try:
+            Log.objects.bulk_create(batch, batch_size=500, ignore_conflicts=True)
+        except Exception as e:
+            logger.warning(f"Bulk log flush failed ({len(batch)} rows): {e}")
+            # Salvage the batch row by row so one bad value doesn't
+            # drop everything that was buffered alongside it
+            for row in batch:
+                try:
+                    row.save()
+                except Exception:
+                    pass
+
+
+# CharField limits; an over-long value fails the whole bulk_create on
+# Postgres (ignore_conflicts only covers constraint conflicts)
+_STATUS_MAX = Log._meta.get_field("status").max_length
+_METHOD_MAX = Log._meta.get_field("request_method").max_length
+_PATH_MAX = Log._meta.get_field("event_path").max_length
+
+
+def _clamp(value, max_length):
+    """Truncate a value to a CharField's max_length, passing None through."""
+    if value is None:
+        return None
+    return str(value)[:max_length]
+
+
+def _enqueue_row(log: Log):
+    global _flush_timer
+    flush_now = False
+    with _BUFFER_LOCK:
+        _BUFFER.append(log)
+        if len(_BUFFER) >= _FLUSH_THRESHOLD:
+            flush_now = True
+        elif _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_INTERVAL, _flush_buffer)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+    if flush_now:
+        # Flush on a worker thread so no caller pays the DB round trip;
+        # the timer-fired flushes already run on their own thread
+        threading.Thread(target=_flush_buffer, name="log-flush", daemon=True).start()
+
+
+atexit.register(_flush_buffer)
+
+
+def _sampled_out(status):
+    """True when a successful request's log should be dropped by sampling."""
+    rate = getattr(settings, "LOGGER_SAMPLE_RATE", 1.0)
+    if rate >= 1.0:
+        return False
+    try:
+        success = 200 <= int(status) < 400
+    except (TypeError, ValueError):
+        success = False
+    return success and random.random() > rate
+
+
+def _compact_dump(obj, max_bytes=65536):
+    """
+    Compact JSON dump of a log payload, capped in size.
+
+    Compact separators shave the whitespace overhead, and the cap keeps
+    one oversized multipart payload from ballooning a log row (and its
+    trip to the database).
+    """
+    result = json.dumps(
+        obj,
+        default=str,
+        cls=DjangoJSONEncoder,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    if len(result) > max_bytes:
+        return result[:max_bytes] + '..."__truncated__"'
+    return result
 
 
 class LoggerService:
@@ -31,52 +135,54 @@ class LoggerService:
 
     @staticmethod
     def create_logg(status, request, output, background_task=False):
+        if _sampled_out(status):
+            return
+
         if isinstance(request, dict):
-            input_data = json.dumps(request, default=str, cls=DjangoJSONEncoder)
-
-            log_serializer = LogSerializer(
-                data={
-                    "status": status,
-                    "event_path": request["path"],
-                    "request_method": request["method"],
-                    "input": str(input_data),
-                    "output": str(output),
-                }
-            )
-            log_serializer.is_valid(raise_exception=True)
-            log_serializer.save()
+            input_data = _compact_dump(request)
 
+            _enqueue_row(
+                Log(
+                    status=_clamp(status, _STATUS_MAX),
+                    event_path=_clamp(request["path"], _PATH_MAX),
+                    request_method=_clamp(request["method"], _METHOD_MAX),
+                    input=input_data,
+                    output=str(output),
+                )
+            )
             return
 
         # drop any kind of files from input data to avoid any kind of errors
         if background_task:
-            input_data = json.dumps(request.data, default=str, cls=DjangoJSONEncoder)
+            input_data = _compact_dump(request.data)
         else:
             LoggerService.delete_in_memory_files(request.data)
-            input_data = deepcopy(request.data)
-
-        log_serializer = LogSerializer(
-            data={
-                "status": status,
-                "event_path": request.path,
-                "request_method": request.method,
-                "input": str(input_data),
-                "output": str(output),
-            }
+            # Serialize straight from the (filtered) payload; copying it
+            # first just to stringify doubled the allocation for nothing.
+            # getlist keeps multi-value QueryDict keys intact.
+            data = request.data
+            if hasattr(data, "getlist"):
+                data = {key: data.getlist(key) for key in data}
+            input_data = _compact_dump(data)
+
+        _enqueue_row(
+            Log(
+                status=_clamp(status, _STATUS_MAX),
+                event_path=_clamp(request.path, _PATH_MAX),
+                request_method=_clamp(request.method, _METHOD_MAX),
+                input=input_data,
+                output=str(output),
+            )
         )
-        log_serializer.is_valid(raise_exception=True)
-        log_serializer.save()
 
     @staticmethod
     def create__manual_logg(status, event_path, request_method, input_data, output):
-        log_serializer = LogSerializer(
-            data={
-                "status": status,
-                "event_path": event_path,
-                "request_method": request_method,
-                "input": str(input_data),
-                "output": str(output),
-            }
+        _enqueue_row(
+            Log(
+                status=_clamp(status, _STATUS_MAX),
+                event_path=_clamp(event_path, _PATH_MAX),
+                request_method=_clamp(request_method, _METHOD_MAX),
+                input=str(input_data),
+                output=str(output),
+            )
         )
-        log_serializer.is_valid(raise_exception=True)
-        log_serializer.save()
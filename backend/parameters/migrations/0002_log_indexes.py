@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("parameters", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="log",
+            index=models.Index(fields=["-timestamp"], name="log_timestamp_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="log",
+            index=models.Index(
+                fields=["event_path", "-timestamp"], name="log_path_timestamp_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="log",
+            index=models.Index(
+                fields=["status", "-timestamp"], name="log_status_timestamp_idx"
+            ),
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 
 class Parameters(models.Model):
@@ -22,3 +25,23 @@ class Log(models.Model):
     event_path = models.CharField(max_length=150)
     input = models.TextField()
     output = models.TextField(blank=True)
+
+    class Meta:
+        # Logs are read back newest-first, filtered by path or status;
+        # without these the admin/debug queries scan the whole table
+        indexes = [
+            models.Index(fields=["-timestamp"], name="log_timestamp_idx"),
+            models.Index(
+                fields=["event_path", "-timestamp"], name="log_path_timestamp_idx"
+            ),
+            models.Index(
+                fields=["status", "-timestamp"], name="log_status_timestamp_idx"
+            ),
+        ]
+
+
+@receiver(post_save, sender=Parameters)
+@receiver(post_delete, sender=Parameters)
+def _invalidate_parameter_cache(sender, instance, **kwargs):
+    """Drop the cached value when a parameter row changes."""
+    cache.delete(f"param:{instance.name}")
@@ -1,7 +1,10 @@
-import random
+import secrets
+from functools import lru_cache
 
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db.models import Q
 from django.utils import timezone
-from rest_framework.authtoken.models import Token
 from rest_framework.exceptions import ValidationError
 
 from authentication.models import EmailVerification
@@ -22,6 +25,23 @@ from user.models import AppleUser
 from user.serializers import UserSerializer
 from user.services.platform_roles import platform_roles
 
+# Platform roles are seed data; one lookup per process beats one per signup
+_roles = lru_cache(maxsize=1)(platform_roles)
+
+
+# Parameters rows are near-immutable config; re-reading them from the
+# database on every OTP send/validate is a wasted hot-path SELECT
+PARAM_CACHE_TTL = 600
+
+
+def _param(name):
+    """Cached Parameters value (invalidated on save in parameters.models)."""
+    return cache.get_or_set(
+        f"param:{name}",
+        lambda: Parameters.objects.values_list("value", flat=True).get(name=name),
+        PARAM_CACHE_TTL,
+    )
+
 
 class MockVerification:
     """Mock verification object for test cases to mimic EmailVerification model"""
@@ -38,13 +58,11 @@ class OTPHandling:
             email_ = email
         elif request.data.get("email"):
             email_ = request.data.get("email")
-        elif request.headers.get("Authorization"):
-            token = request.headers.get("Authorization").split(" ")[1]
-            try:
-                user = Token.objects.get(key=token).user
-            except Token.DoesNotExist:
-                raise ValidationError({"Error": ["Invalid token"]})
-            email_ = user.email
+        elif getattr(request, "user", None) and request.user.is_authenticated:
+            # TokenAuthentication already resolved the Authorization header
+            # into request.user; re-querying the token table repeated that
+            # SELECT on every OTP request
+            email_ = request.user.email
         return email_
 
     def generate_otp_token(self, type, phone=None):
@@ -55,26 +73,29 @@ class OTPHandling:
             or settings.ENVIRONMENT not in settings.PROD_ENVIRONMENTS
         ):
             return "000000"
-        return "".join([str(random.randint(0, 9)) for _ in range(6)])
+        # One CSPRNG draw instead of six Mersenne Twister calls; random
+        # was not cryptographically safe for OTPs in the first place
+        return f"{secrets.randbelow(1_000_000):06d}"
 
     def send_otp_token(self, email, verification_code, type, phone):
         """
         Send the OTP token to the user
         """
         if phone and type != "email":
-            # Validate phone number exists in entity object
-            try:
-                if email:
-                    entity = Member.objects.filter(user__email=email).first()
-                else:
-                    entity = Member.objects.filter(user__phone=phone).first()
-                if entity:
-                    if not entity.user.phone:
-                        raise ValidationError(detail="Invalid credentials")
-                    elif entity.user.phone != phone:
-                        raise ValidationError(detail="Invalid credentials")
-            except Member.DoesNotExist:
-                pass
+            # Validate phone number exists in entity object. select_related
+            # pulls the user row in the same query instead of a second
+            # SELECT when entity.user.phone is read; .first() returns None
+            # rather than raising, so no DoesNotExist handling is needed.
+            members = Member.objects.select_related("user").only("user__phone")
+            if email:
+                entity = members.filter(user__email=email).first()
+            else:
+                entity = members.filter(user__phone=phone).first()
+            if entity:
+                if not entity.user.phone:
+                    raise ValidationError(detail="Invalid credentials")
+                elif entity.user.phone != phone:
+                    raise ValidationError(detail="Invalid credentials")
         if email:
             EmailVerification.objects.update_or_create(
                 email=email,
@@ -87,10 +108,11 @@ class OTPHandling:
                 },
             )
         elif phone:
+            # email is always falsy on this branch; writing it would just
+            # null the column on every resend
             EmailVerification.objects.update_or_create(
                 phone=phone,
                 defaults={
-                    "email": email,
                     "verification_code": verification_code,
                     "created_at": timezone.now(),
                     "type": type,
@@ -104,7 +126,7 @@ class OTPHandling:
             message = f"Don Juan: Your authentication code is {verification_code}. Do not share this code with anyone."
             send_sms(message, phone)
         elif type == "whatsapp":
-            service_sid = Parameters.objects.get(name="TWILIO_WHATSAPP_OTP").value
+            service_sid = _param("TWILIO_WHATSAPP_OTP")
             send_otp_whatsapp(phone, service_sid)
 
     def validate_otp_token(self, request, otp_code, email=None):
@@ -123,17 +145,20 @@ class OTPHandling:
             data={"email": email, "code": otp_code, "phone": phone}
         )
         serializer.is_valid(raise_exception=True)
-        # Check whatsapp verification
-        try:
-            if email:
-                verification = EmailVerification.objects.get(
-                    email=email, type="whatsapp"
-                )
-            else:
-                verification = EmailVerification.objects.get(
-                    phone=phone, type="whatsapp"
-                )
-            service_sid = Parameters.objects.get(name="TWILIO_WHATSAPP_OTP").value
+
+        # One SELECT covering both the whatsapp row and the direct code
+        # match, instead of two sequential .get() round-trips
+        identity = Q(email=email) if email else Q(phone=phone)
+        candidates = list(
+            EmailVerification.objects.filter(
+                identity & (Q(type="whatsapp") | Q(verification_code=otp_code))
+            ).order_by("-created_at")
+        )
+
+        # Check whatsapp verification first, mirroring the old lookup order
+        verification = next((v for v in candidates if v.type == "whatsapp"), None)
+        if verification is not None:
+            service_sid = _param("TWILIO_WHATSAPP_OTP")
             if (
                 verification.is_valid()
                 and verify_otp_whatsapp(
@@ -142,34 +167,24 @@ class OTPHandling:
                 == "approved"
             ):
                 verification.is_used = True
-                verification.save()
-                return verification, email
-        except EmailVerification.DoesNotExist:
-            pass
-        try:
-            if email:
-                verification = EmailVerification.objects.get(
-                    email=email, verification_code=otp_code
-                )
-            else:
-                verification = EmailVerification.objects.get(
-                    phone=phone, verification_code=otp_code
-                )
-            if verification.is_valid():
-                verification.is_used = True
-                verification.save()
+                verification.save(update_fields=["is_used"])
                 return verification, email
-            else:
-                return False, None
-        except EmailVerification.DoesNotExist:
-            return False, None
+
+        verification = next(
+            (v for v in candidates if v.verification_code == otp_code), None
+        )
+        if verification is not None and verification.is_valid():
+            verification.is_used = True
+            verification.save(update_fields=["is_used"])
+            return verification, email
+        return False, None
 
 
 class UserSignup:
     def signup(self, custom_request, platform_role):
         custom_request["is_external"] = False
         custom_request["is_active"] = True
-        custom_request["platform_role"] = platform_roles()[platform_role]
+        custom_request["platform_role"] = _roles()[platform_role]
 
         # lower email
         custom_request["email"] = (
@@ -178,10 +193,12 @@ class UserSignup:
 
         user_serializer = UserSerializer(data=custom_request)
         if user_serializer.is_valid(raise_exception=True):
-            user = user_serializer.Meta.model(**user_serializer.validated_data)
+            # Hash up front and let the serializer's create() perform the
+            # single INSERT, instead of hand-building the model instance
             if password := custom_request.get("password"):
-                user.set_password(password)
-            user.save()
+                user = user_serializer.save(password=make_password(password))
+            else:
+                user = user_serializer.save()
 
             if custom_request.get("apple_id"):
                 AppleUser.objects.update_or_create(
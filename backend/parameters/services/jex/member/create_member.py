@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from core.drf import NonCriticalValidationError
@@ -9,23 +13,26 @@ from user.models import User
 from user.serializers import UserSerializer
 from user.services.platform_roles import platform_roles
 
+# Platform roles are seed data; one lookup per process beats one per signup
+_roles = lru_cache(maxsize=1)(platform_roles)
+
 
+@transaction.atomic
 def create_member(custom_request, fake_user=False):
     if user_id := custom_request.get("user"):
         user = get_object_or_404(User, id=user_id)
-        user.platform_role_id = platform_roles()["MEMBER"]
+        user.platform_role_id = _roles()["MEMBER"]
         user.save()
         if member := Member.objects.filter(user=user).first():
             return MemberSerializer(member).data, user
     else:
         if custom_request.get("email"):
             custom_request["email"] = custom_request["email"].lower()
-            user = User.objects.filter(email=custom_request.get("email")).first()
-            if user:
+            # exists() stops at the first match without materializing a row
+            if User.objects.filter(email=custom_request["email"]).exists():
                 raise NonCriticalValidationError({"email": ["User already exists"]})
         elif custom_request.get("phone"):
-            user = User.objects.filter(phone=custom_request.get("phone")).first()
-            if user:
+            if User.objects.filter(phone=custom_request.get("phone")).exists():
                 raise NonCriticalValidationError({"phone": ["User already exists"]})
         else:
             raise NonCriticalValidationError({"email": ["Email or phone is required"]})
@@ -33,15 +40,17 @@ def create_member(custom_request, fake_user=False):
         if avatar_raw := custom_request.get("avatar"):
             custom_request["avatar"] = avatar_raw
         custom_request["is_active"] = True
-        custom_request["platform_role"] = platform_roles()["MEMBER"]
+        custom_request["platform_role"] = _roles()["MEMBER"]
         # Create User using serializer.Meta.model(**serializer.validated_data)
         user_serializer = UserSerializer(data=custom_request)
         if user_serializer.is_valid(raise_exception=True):
             user = user_serializer.save()
             password = custom_request.get("password")
             if password is not None:
-                user.set_password(password)
-                user.save()
+                # Targeted UPDATE of the one changed column instead of a
+                # second full save (and its signal round)
+                user.password = make_password(password)
+                User.objects.filter(pk=user.pk).update(password=user.password)
 
     # The user variable is always defined at this point (either from the existing user or newly created)
     if user: